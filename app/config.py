@@ -1,7 +1,30 @@
-from pydantic_settings import BaseSettings
+from functools import lru_cache, cached_property
+from pydantic_settings import BaseSettings, SettingsConfigDict
 from pydantic import Field
 from typing import Optional
 
+class WompiSettings(BaseSettings):
+    """Wompi - Pasarela de pagos"""
+    public_key: Optional[str] = Field(default=None, alias='WOMPI_PUBLIC_KEY')
+    private_key: Optional[str] = Field(default=None, alias='WOMPI_PRIVATE_KEY')
+    events_secret: Optional[str] = Field(default=None, alias='WOMPI_EVENTS_SECRET')
+    integrity_secret: Optional[str] = Field(default=None, alias='WOMPI_INTEGRITY_SECRET')
+    environment: str = Field(default='sandbox', alias='WOMPI_ENVIRONMENT')
+
+    model_config = SettingsConfigDict(env_file=".env", extra="ignore", frozen=True)
+
+
+class R2Settings(BaseSettings):
+    """Cloudflare R2 - S3-compatible storage"""
+    access_key_id: Optional[str] = Field(default=None, alias='NUXT_PRIVATE_R2_ACCESS_KEY_ID')
+    secret_access_key: Optional[str] = Field(default=None, alias='NUXT_PRIVATE_R2_SECRET_ACCESS_KEY')
+    endpoint: Optional[str] = Field(default=None, alias='NUXT_PRIVATE_R2_ENDPOINT')
+    bucket: str = Field(default='warotickets-assets', alias='NUXT_PRIVATE_R2_BUCKET')
+    public_url: str = Field(default='https://pub-d8ad9fd795034ce2acb372a708fa9538.r2.dev', alias='NUXT_PRIVATE_R2_PUBLIC_URL')
+
+    model_config = SettingsConfigDict(env_file=".env", extra="ignore", frozen=True)
+
+
 class Settings(BaseSettings):
     # Database - mapeando desde las variables de warolabs
     database_url: str
@@ -10,6 +33,19 @@ class Settings(BaseSettings):
     db_password: str = Field(alias='NUXT_PRIVATE_DB_PASSWORD')
     db_port: int = Field(default=5432, alias='NUXT_PRIVATE_DB_PORT')
     db_name: str = Field(alias='NUXT_PRIVATE_DB_NAME')
+    # Pool sizing; min_size connections are opened at startup so traffic spikes
+    # don't pay connection handshakes. The two pools split one per-process
+    # budget (10 min / 30 max in total), so keep the sum under Postgres
+    # max_connections divided by the number of replicas
+    db_pool_min_size: int = Field(default=5, alias='DB_POOL_MIN_SIZE')
+    db_pool_max_size: int = Field(default=15, alias='DB_POOL_MAX_SIZE')
+    # Pool for use_transaction=False (autocommit: reads and single-statement writes)
+    db_autocommit_pool_min_size: int = Field(default=5, alias='DB_AUTOCOMMIT_POOL_MIN_SIZE')
+    db_autocommit_pool_max_size: int = Field(default=15, alias='DB_AUTOCOMMIT_POOL_MAX_SIZE')
+    # Prepared statement cache per connection (LRU keyed by SQL text); sized above
+    # the number of distinct queries so hot ones are never re-parsed.
+    # Set to 0 behind pgbouncer (transaction mode)
+    db_statement_cache_size: int = Field(default=1024, alias='DB_STATEMENT_CACHE_SIZE')
 
     # JWT Security
     jwt_secret: str = Field(alias='NUXT_PRIVATE_JWT_SECRET')
@@ -28,24 +64,10 @@ class Settings(BaseSettings):
         alias='EMAIL_SIGNATURE'
     )
 
-    # Cloudflare R2 - S3-compatible storage
-    r2_access_key_id: Optional[str] = Field(default=None, alias='NUXT_PRIVATE_R2_ACCESS_KEY_ID')
-    r2_secret_access_key: Optional[str] = Field(default=None, alias='NUXT_PRIVATE_R2_SECRET_ACCESS_KEY')
-    r2_endpoint: Optional[str] = Field(default=None, alias='NUXT_PRIVATE_R2_ENDPOINT')
-    r2_bucket: str = Field(default='warotickets-assets', alias='NUXT_PRIVATE_R2_BUCKET')
-    r2_public_url: str = Field(default='https://pub-d8ad9fd795034ce2acb372a708fa9538.r2.dev', alias='NUXT_PRIVATE_R2_PUBLIC_URL')
-
     # Encryption
     private_key_encrypter: Optional[str] = Field(default=None, alias='NUXT_PRIVATE_PRIVATE_KEY_ENCRYPTER')
     public_key_encrypter: Optional[str] = Field(default=None, alias='NUXT_PUBLIC_PUBLIC_KEY_ENCRYPTER')
 
-    # Wompi - Pasarela de pagos
-    wompi_public_key: Optional[str] = Field(default=None, alias='WOMPI_PUBLIC_KEY')
-    wompi_private_key: Optional[str] = Field(default=None, alias='WOMPI_PRIVATE_KEY')
-    wompi_events_secret: Optional[str] = Field(default=None, alias='WOMPI_EVENTS_SECRET')
-    wompi_integrity_secret: Optional[str] = Field(default=None, alias='WOMPI_INTEGRITY_SECRET')
-    wompi_environment: str = Field(default='sandbox', alias='WOMPI_ENVIRONMENT')
-
     # App settings
     app_env: str = Field(default="development", alias='APP_ENV')
     environment: str = Field(default="development", alias='NODE_ENV')
@@ -69,11 +91,21 @@ class Settings(BaseSettings):
     discord_transfer_webhook_url: Optional[str] = Field(default=None, alias='DISCORD_TRANSFER_WEBHOOK_URL')
     discord_error_webhook_url: Optional[str] = Field(default=None, alias='DISCORD_ERROR_WEBHOOK_URL')
 
-    class Config:
-        env_file = ".env"
-        extra = "ignore"
+    # Settings are read-only after construction, which makes the derived
+    # values below safe to compute once per instance.
+    model_config = SettingsConfigDict(env_file=".env", extra="ignore", frozen=True)
+
+    # Optional integration groups are only read from env on first access,
+    # so processes that never touch payments/uploads don't validate them.
+    @cached_property
+    def wompi(self) -> WompiSettings:
+        return WompiSettings()
 
-    @property
+    @cached_property
+    def r2(self) -> R2Settings:
+        return R2Settings()
+
+    @cached_property
     def db_connection_params(self) -> dict:
         return {
             "host": self.db_host,
@@ -83,16 +115,37 @@ class Settings(BaseSettings):
             "database": self.db_name,
         }
 
-    @property
+    @cached_property
+    def cors_origins_list(self) -> tuple[str, ...]:
+        """CORS_ORIGINS parsed from its comma-separated form"""
+        return tuple(o.strip() for o in self.cors_origins.split(",") if o.strip())
+
+    @cached_property
+    def localhost_map(self) -> dict[str, str]:
+        """LOCALHOST_MAPPING parsed as {"localhost:port": "domain"}"""
+        mapping = {}
+        for entry in self.localhost_mapping.split(","):
+            host, sep, site = entry.partition("=")
+            if sep and host.strip() and site.strip():
+                mapping[host.strip()] = site.strip()
+        return mapping
+
+    @cached_property
     def is_development(self) -> bool:
         return self.app_env in ("development", "local") or self.environment == "development"
 
-    @property
+    @cached_property
     def is_production(self) -> bool:
         return self.app_env == "production" or self.environment == "production"
 
-    @property
+    @cached_property
     def is_staging(self) -> bool:
         return self.app_env == "staging"
 
-settings = Settings()
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Return the process-wide Settings instance (parsed from env/.env once)"""
+    return Settings()
+
+
+settings = get_settings()
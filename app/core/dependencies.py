@@ -1,12 +1,15 @@
 from fastapi import Depends, Request, HTTPException
 from app.core.middleware import SessionContext, TenantContext, get_session_context, get_tenant_context
 from app.core.exceptions import AuthenticationError, AuthorizationError
+from app.config import settings
 from typing import Optional
 import logging
 import os
 
 logger = logging.getLogger(__name__)
 
+_environment_logged = False
+
 
 def get_current_session(request: Request) -> SessionContext:
     """
@@ -52,7 +55,7 @@ async def get_current_user_id(request: Request) -> Optional[str]:
     Returns None if not authenticated.
     """
     session = get_session_context(request)
-    return str(session.user_id) if session.is_valid else None
+    return session.user_id_str if session.is_valid else None
 
 
 async def require_user_id(request: Request) -> str:
@@ -63,7 +66,7 @@ async def require_user_id(request: Request) -> str:
     session = get_session_context(request)
     if not session.is_valid or not session.user_id:
         raise AuthenticationError("Authentication required")
-    return str(session.user_id)
+    return session.user_id_str
 
 
 async def get_tenant_id(request: Request) -> Optional[str]:
@@ -72,7 +75,7 @@ async def get_tenant_id(request: Request) -> Optional[str]:
     Returns None if tenant not detected.
     """
     tenant = get_tenant_context(request)
-    return str(tenant.tenant_id) if tenant.is_valid else None
+    return tenant.tenant_id_str if tenant.is_valid else None
 
 
 async def require_tenant_id(request: Request) -> str:
@@ -83,7 +86,7 @@ async def require_tenant_id(request: Request) -> str:
     tenant = get_tenant_context(request)
     if not tenant.is_valid or not tenant.tenant_id:
         raise HTTPException(status_code=400, detail="Valid tenant required")
-    return str(tenant.tenant_id)
+    return tenant.tenant_id_str
 
 
 class AuthenticatedUser:
@@ -91,6 +94,8 @@ class AuthenticatedUser:
     Dependency class that provides both user and tenant context.
     Use this for endpoints that require authentication.
     """
+    __slots__ = ('session', 'tenant', 'user_id', 'tenant_id', 'email', 'name')
+
     def __init__(self, request: Request):
         self.session = get_session_context(request)
         self.tenant = get_tenant_context(request)
@@ -101,23 +106,10 @@ class AuthenticatedUser:
         if not self.tenant.is_valid:
             raise HTTPException(status_code=400, detail="Valid tenant required")
 
-    @property
-    def user_id(self) -> str:
-        return str(self.session.user_id)
-
-    @property
-    def tenant_id(self) -> str:
-        tid = str(self.session.tenant_id)
-        logger.info(f"AuthenticatedUser.tenant_id: session.tenant_id={self.session.tenant_id}, returning={tid}")
-        return tid
-
-    @property
-    def email(self) -> str:
-        return self.session.email
-
-    @property
-    def name(self) -> str:
-        return self.session.name
+        self.user_id = self.session.user_id_str
+        self.tenant_id = self.session.tenant_id_str
+        self.email = self.session.email
+        self.name = self.session.name
 
 
 def get_authenticated_user(request: Request) -> AuthenticatedUser:
@@ -130,23 +122,17 @@ class AuthenticatedBuyer:
     Dependency class that provides user context WITHOUT requiring tenant.
     Use this for buyer endpoints (e.g. my-tickets) where tenant is not needed.
     """
+    __slots__ = ('session', 'user_id', 'email', 'name')
+
     def __init__(self, request: Request):
         self.session = get_session_context(request)
 
         if not self.session.is_valid:
             raise AuthenticationError("Authentication required")
 
-    @property
-    def user_id(self) -> str:
-        return str(self.session.user_id)
-
-    @property
-    def email(self) -> str:
-        return self.session.email
-
-    @property
-    def name(self) -> str:
-        return self.session.name
+        self.user_id = self.session.user_id_str
+        self.email = self.session.email
+        self.name = self.session.name
 
 
 def get_authenticated_buyer(request: Request) -> AuthenticatedBuyer:
@@ -160,8 +146,10 @@ def get_environment() -> str:
     Reads from settings.app_env (loaded from .env file).
     Returns 'prod' by default if not set.
     """
-    from app.config import settings
+    global _environment_logged
     env = settings.app_env
-    logger.info(f"get_environment() called - APP_ENV from settings: '{env}'")
+    if not _environment_logged:
+        logger.info(f"get_environment() - APP_ENV from settings: '{env}'")
+        _environment_logged = True
     # Normalize to only allow 'dev' or 'prod'
     return "dev" if env in ("dev", "local") else "prod"
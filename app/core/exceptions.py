@@ -1,86 +1,104 @@
+from __future__ import annotations
+
 from fastapi import Request
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 import logging
-from typing import Dict, Any
-from app.core.logging import log_request_context
+from typing import Any
+from app.core.logging import log_request_context, utc_timestamp
 
 logger = logging.getLogger(__name__)
 
 class APIError(Exception):
-    """Base API exception"""
+    """Base API exception
+
+    Subclasses only set status_code/default_message as class attributes;
+    the single __init__ below serves all of them.
+    """
+    __slots__ = ('message', 'details')
+
+    status_code = 500
+    default_message = "Error"
 
-    def __init__(self, message: str, status_code: int = 500, details: Dict[str, Any] = None):
-        self.message = message
-        self.status_code = status_code
+    def __init__(self, message: str = None, details: dict[str, Any] = None):
+        self.message = message or self.default_message
         self.details = details or {}
         super().__init__(self.message)
 
 class AuthenticationError(APIError):
     """Authentication related errors"""
+    __slots__ = ()
 
-    def __init__(self, message: str = "Authentication required", details: Dict[str, Any] = None):
-        super().__init__(message, 401, details)
+    status_code = 401
+    default_message = "Authentication required"
 
 class AuthorizationError(APIError):
     """Authorization related errors"""
+    __slots__ = ()
 
-    def __init__(self, message: str = "Access denied", details: Dict[str, Any] = None):
-        super().__init__(message, 403, details)
+    status_code = 403
+    default_message = "Access denied"
 
 class TenantError(APIError):
     """Tenant validation errors"""
+    __slots__ = ()
 
-    def __init__(self, message: str = "Invalid tenant", details: Dict[str, Any] = None):
-        super().__init__(message, 404, details)
+    status_code = 404
+    default_message = "Invalid tenant"
 
 class ValidationError(APIError):
     """Validation related errors"""
+    __slots__ = ()
 
-    def __init__(self, message: str = "Validation failed", details: Dict[str, Any] = None):
-        super().__init__(message, 400, details)
+    status_code = 400
+    default_message = "Validation failed"
 
 class DatabaseError(APIError):
     """Database operation errors"""
+    __slots__ = ()
 
-    def __init__(self, message: str = "Database operation failed", details: Dict[str, Any] = None):
-        super().__init__(message, 500, details)
+    status_code = 500
+    default_message = "Database operation failed"
 
 class PaymentError(APIError):
     """Payment processing errors"""
+    __slots__ = ()
 
-    def __init__(self, message: str = "Payment failed", details: Dict[str, Any] = None):
-        super().__init__(message, 402, details)
+    status_code = 402
+    default_message = "Payment failed"
 
 class ReservationError(APIError):
     """Reservation related errors"""
+    __slots__ = ()
 
-    def __init__(self, message: str = "Reservation failed", details: Dict[str, Any] = None):
-        super().__init__(message, 400, details)
+    status_code = 400
+    default_message = "Reservation failed"
 
 class TicketError(APIError):
     """Ticket/Unit related errors"""
+    __slots__ = ()
 
-    def __init__(self, message: str = "Ticket operation failed", details: Dict[str, Any] = None):
-        super().__init__(message, 400, details)
+    status_code = 400
+    default_message = "Ticket operation failed"
 
 async def api_exception_handler(request: Request, exc: APIError):
     """Handle custom API exceptions with logging"""
 
     tenant = getattr(request.state, 'tenant', 'unknown')
-    context = log_request_context(tenant)
-    context.update({
+    context = {
+        "timestamp": utc_timestamp(),
+        "tenant": tenant,
         "error_type": exc.__class__.__name__,
         "status_code": exc.status_code,
-        "path": str(request.url.path),
+        "path": request.url.path,
         "method": request.method
-    })
+    }
 
     if exc.status_code >= 500:
-        logger.error(f"API Error: {exc.message}", extra={"context": context})
+        logger.error("API Error: %s", exc.message, extra={"context": context})
     else:
-        logger.warning(f"API Error: {exc.message}", extra={"context": context})
+        logger.warning("API Error: %s", exc.message, extra={"context": context})
 
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=exc.status_code,
         content={
             "error": True,
@@ -97,13 +115,13 @@ async def general_exception_handler(request: Request, exc: Exception):
     context = log_request_context(tenant)
     context.update({
         "error_type": exc.__class__.__name__,
-        "path": str(request.url.path),
+        "path": request.url.path,
         "method": request.method
     })
 
-    logger.error(f"Unexpected error: {str(exc)}", extra={"context": context}, exc_info=True)
+    logger.error("Unexpected error: %s", exc, extra={"context": context}, exc_info=True)
 
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=500,
         content={
             "error": True,
@@ -1,7 +1,14 @@
+from __future__ import annotations
+
+import atexit
 import logging
+import logging.config
+import logging.handlers
+import queue
 import sys
-from typing import Dict, Any
-from datetime import datetime
+from typing import Any
+from datetime import datetime, timezone
+from uuid import UUID
 from app.config import settings
 
 class ColoredFormatter(logging.Formatter):
@@ -16,16 +23,50 @@ class ColoredFormatter(logging.Formatter):
     }
     RESET = '\033[0m'
 
+    # Colored level prefixes, built once instead of per record
+    COLORED_LEVELS = {}
+    for _level, _color in COLORS.items():
+        COLORED_LEVELS[_level] = f"{_color}{_level}{RESET}"
+    del _level, _color
+
     def format(self, record):
-        if hasattr(record, 'levelname'):
-            color = self.COLORS.get(record.levelname, '')
-            record.levelname = f"{color}{record.levelname}{self.RESET}"
-        return super().format(record)
+        # Restore the plain level name afterwards so other handlers sharing
+        # the record don't receive the ANSI codes.
+        levelname = record.levelname
+        record.levelname = self.COLORED_LEVELS.get(levelname, levelname)
+        try:
+            return super().format(record)
+        finally:
+            record.levelname = levelname
+
+# Verbose third-party loggers, capped at WARNING in a single dictConfig pass
+SUPPRESSED_LOGGERS = (
+    "uvicorn.access",
+    "asyncpg",
+    "python_multipart.multipart",
+    "botocore",
+    "httpcore",
+    "httpx",
+    "urllib3",
+    "boto3",
+)
+
+_SUPPRESS_CONFIG = {
+    "version": 1,
+    "incremental": True,
+    "loggers": {name: {"level": "WARNING"} for name in SUPPRESSED_LOGGERS},
+}
+
+_logging_configured = False
 
 def setup_logging():
-    """Setup logging configuration"""
+    """Setup logging configuration (idempotent: later calls reuse the first setup)"""
+    global _logging_configured
 
     root_logger = logging.getLogger()
+    if _logging_configured:
+        return root_logger
+
     root_logger.setLevel(logging.DEBUG if settings.debug else logging.INFO)
 
     root_logger.handlers.clear()
@@ -33,40 +74,55 @@ def setup_logging():
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setLevel(logging.DEBUG if settings.debug else logging.INFO)
 
-    console_format = ColoredFormatter(
+    # ANSI colors only help on a dev terminal; captured container logs get plain text
+    formatter_class = ColoredFormatter if settings.debug else logging.Formatter
+    console_format = formatter_class(
         '%(asctime)s | %(levelname)s | %(name)s | %(message)s',
         datefmt='%Y-%m-%d %H:%M:%S'
     )
     console_handler.setFormatter(console_format)
-    root_logger.addHandler(console_handler)
+
+    # Request handlers only enqueue records; a listener thread does the stdout writes
+    log_queue = queue.SimpleQueue()
+    root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    listener = logging.handlers.QueueListener(log_queue, console_handler, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
 
     # Suppress verbose third-party logs
-    logging.getLogger("uvicorn.access").setLevel(logging.WARNING)
-    logging.getLogger("asyncpg").setLevel(logging.WARNING)
-    logging.getLogger("python_multipart.multipart").setLevel(logging.WARNING)
-    logging.getLogger("botocore").setLevel(logging.WARNING)
-    logging.getLogger("httpcore").setLevel(logging.WARNING)
-    logging.getLogger("httpx").setLevel(logging.WARNING)
-    logging.getLogger("urllib3").setLevel(logging.WARNING)
-    logging.getLogger("boto3").setLevel(logging.WARNING)
+    logging.config.dictConfig(_SUPPRESS_CONFIG)
 
+    _logging_configured = True
     return root_logger
 
 def get_logger(name: str) -> logging.Logger:
     """Get logger instance for module"""
     return logging.getLogger(name)
 
-def log_request_context(tenant: str, session_id: str = None, user_id: str = None) -> Dict[str, Any]:
+def _short_id(value) -> str:
+    """First 8 characters of an id; UUIDs are read from .hex without a full str()"""
+    short = value.hex[:8] if isinstance(value, UUID) else str(value)[:8]
+    return f"{short}..."
+
+def utc_timestamp() -> datetime:
+    """
+    Current UTC time as a naive datetime.
+    Error responses expose it as "timestamp"; clients expect the naive ISO
+    format (no +00:00 offset) that datetime.utcnow() used to produce.
+    """
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+def log_request_context(tenant: str, session_id: str = None, user_id: str = None) -> dict[str, Any]:
     """Create request context for logging"""
     context = {
-        "timestamp": datetime.utcnow().isoformat(),
+        "timestamp": utc_timestamp(),
         "tenant": tenant,
     }
 
     if session_id:
-        context["session_id"] = str(session_id)[:8] + "..."
+        context["session_id"] = _short_id(session_id)
 
     if user_id:
-        context["user_id"] = str(user_id)[:8] + "..."
+        context["user_id"] = _short_id(user_id)
 
     return context
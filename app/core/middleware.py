@@ -1,17 +1,35 @@
 import logging
 import time
-from typing import Optional, Dict, Any
-from urllib.parse import urlparse
-from fastapi import Request, Response
-from fastapi.responses import JSONResponse
-from app.database import get_db_connection
+from typing import Optional, Dict, Any, Mapping
+from fastapi import Request
+from starlette.types import ASGIApp, Receive, Scope, Send
 from app.config import settings
+from app.core.exceptions import AuthenticationError, ValidationError
+from app.core.security import get_session_from_request
 
 logger = logging.getLogger(__name__)
 
+# Skip tenant detection for health checks, docs, webhooks, public endpoints and root endpoint
+TENANT_SKIP_PATHS = frozenset({'/health', '/docs', '/redoc', '/openapi.json', '/'})
+TENANT_SKIP_PREFIXES = ('/payments/webhooks', '/public', '/cart', '/invitations/accept')
+
+# Endpoints that never need a session (matched as prefixes, '/' matched exactly)
+SESSION_PUBLIC_PREFIXES = (
+    '/docs', '/redoc', '/openapi.json', '/health',
+    '/auth/sign-in-magic-link', '/auth/verify-code', '/auth/verify',
+    '/transfers/accept-public',
+    '/invitations/accept',
+    '/public', '/webhooks',
+)
+
 class SessionContext:
-    """Session context object"""
-    def __init__(self, session_data: Optional[Dict[str, Any]] = None):
+    """Session context object (accepts a dict or an asyncpg Record)"""
+    __slots__ = (
+        'user_id', 'tenant_id', 'email', 'name', 'expires_at', 'is_active', 'is_valid',
+        'user_id_str', 'tenant_id_str',
+    )
+
+    def __init__(self, session_data: Optional[Mapping[str, Any]] = None):
         if session_data:
             self.user_id = session_data['user_id']
             self.tenant_id = session_data['tenant_id']
@@ -29,6 +47,10 @@ class SessionContext:
             self.is_active = False
             self.is_valid = False
 
+        # String forms of the ids, computed once for the request dependencies
+        self.user_id_str = str(self.user_id) if self.user_id is not None else None
+        self.tenant_id_str = str(self.tenant_id) if self.tenant_id is not None else None
+
     def to_dict(self) -> Dict[str, Any]:
         return {
             'user_id': self.user_id,
@@ -41,8 +63,13 @@ class SessionContext:
         }
 
 class TenantContext:
-    """Tenant context object"""
-    def __init__(self, tenant_data: Optional[Dict[str, Any]] = None):
+    """Tenant context object (accepts a dict or an asyncpg Record)"""
+    __slots__ = (
+        'tenant_id', 'tenant_name', 'tenant_slug', 'tenant_email', 'site', 'brand_name',
+        'is_active', 'is_valid', 'tenant_id_str',
+    )
+
+    def __init__(self, tenant_data: Optional[Mapping[str, Any]] = None):
         if tenant_data:
             self.tenant_id = tenant_data['tenant_id']
             self.tenant_name = tenant_data['tenant_name']
@@ -62,6 +89,8 @@ class TenantContext:
             self.is_active = False
             self.is_valid = False
 
+        self.tenant_id_str = str(self.tenant_id) if self.tenant_id is not None else None
+
     def to_dict(self) -> Dict[str, Any]:
         return {
             'tenant_id': self.tenant_id,
@@ -74,152 +103,96 @@ class TenantContext:
             'is_valid': self.is_valid
         }
 
-async def tenant_detection_middleware(request: Request, call_next):
-    """
-    Middleware to detect tenant from user session.
-    Validates that user is a tenant_member (not based on tenant_sites).
-    Sets request.state.tenant_context for use in endpoints.
-    """
-    try:
-        # Skip tenant detection for health checks, docs, webhooks, public endpoints and root endpoint
-        skip_paths = ['/health', '/docs', '/redoc', '/openapi.json', '/']
-        skip_prefixes = ['/payments/webhooks', '/public', '/cart', '/invitations/accept']
-
-        if request.url.path in skip_paths or any(request.url.path.startswith(p) for p in skip_prefixes):
-            request.state.tenant_context = TenantContext()
-            return await call_next(request)
-
-        # Get tenant from user session - validate by tenant_member, not tenant_sites
-        session_token = request.cookies.get("session-token")
-        logger.info(f"tenant_detection_middleware: path={request.url.path}, session_token={session_token[:20] if session_token else 'None'}...")
-        if session_token:
-            try:
-                async with get_db_connection(use_transaction=False) as conn:
-                    # Get session with tenant and validate membership
-                    query = """
-                        SELECT s.tenant_id, s.user_id,
-                               t.name as tenant_name, t.slug as tenant_slug, t.email as tenant_email
-                        FROM sessions s
-                        JOIN tenants t ON s.tenant_id = t.id
-                        JOIN tenant_members tm ON tm.tenant_id = t.id AND tm.user_id = s.user_id
-                        WHERE s.id = $1 AND s.expires_at > NOW() AND s.is_active = true
-                        LIMIT 1
-                    """
-                    result = await conn.fetchrow(query, session_token)
-                    if result:
-                        logger.info(f"tenant_detection_middleware: found session for tenant_id={result['tenant_id']}, tenant_name={result['tenant_name']}")
-                        # Try to get brand_name from tenant_sites if it exists
-                        site_result = await conn.fetchrow(
-                            "SELECT site, brand_name FROM tenant_sites WHERE tenant_id = $1 AND is_active = true LIMIT 1",
-                            result['tenant_id']
-                        )
-
-                        tenant_context = TenantContext({
-                            'tenant_id': result['tenant_id'],
-                            'tenant_name': result['tenant_name'],
-                            'tenant_slug': result['tenant_slug'],
-                            'tenant_email': result['tenant_email'],
-                            'site': site_result['site'] if site_result else None,
-                            'brand_name': site_result['brand_name'] if site_result else result['tenant_name'],
-                            'is_active': True
-                        })
-                        request.state.tenant_context = tenant_context
-                        return await call_next(request)
-            except Exception as e:
-                logger.warning(f"Failed to get tenant from session: {e}")
-
-        # No valid session - let the endpoint handle authentication
-        # (session_validation_middleware will handle auth errors)
-        request.state.tenant_context = TenantContext()
-        return await call_next(request)
-
-    except Exception as e:
-        logger.error(f"Tenant detection middleware error: {e}", exc_info=True)
-        request.state.tenant_context = TenantContext()
-        return JSONResponse(
-            status_code=500,
-            content={"error": "Internal server error during tenant detection"}
-        )
+def _set_tenant_state(state: Dict[str, Any], tenant_context: TenantContext):
+    """Store the tenant context plus the tenant label read by the exception handlers"""
+    state['tenant_context'] = tenant_context
+    state['tenant'] = tenant_context.tenant_slug or 'unknown'
 
 def get_tenant_context(request: Request) -> TenantContext:
     """Helper function to get tenant context from request"""
-    return getattr(request.state, 'tenant_context', TenantContext())
+    tenant_context = getattr(request.state, 'tenant_context', None)
+    if tenant_context is None:
+        # Cache the empty context so later dependencies reuse it
+        tenant_context = TenantContext()
+        request.state.tenant_context = tenant_context
+    return tenant_context
 
 def require_valid_tenant(request: Request) -> TenantContext:
     """Helper function that raises error if no valid tenant context"""
     tenant_context = get_tenant_context(request)
     if not tenant_context.is_valid:
-        from app.core.exceptions import ValidationError
         raise ValidationError("Valid tenant context required")
     return tenant_context
 
-async def session_validation_middleware(request: Request, call_next):
-    """
-    Middleware to validate session for protected endpoints
-    Sets request.state.session_context for use in endpoints
-    """
-    try:
-        path = request.url.path
-        public_endpoints = [
-            '/docs', '/openapi.json', '/health',
-            '/auth/sign-in-magic-link', '/auth/verify-code', '/auth/verify',
-            '/transfers/accept-public',
-            '/invitations/accept'
-        ]
-
-        public_prefixes = ['/public', '/webhooks']
-
-        if path == '/' or any(path.startswith(endpoint) for endpoint in public_endpoints) or any(path.startswith(prefix) for prefix in public_prefixes):
-            request.state.session_context = SessionContext()
-            return await call_next(request)
-
-        from app.core.security import get_session_from_request
-        try:
-            session_data = await get_session_from_request(request)
-            if session_data:
-                request.state.session_context = SessionContext(session_data)
-            else:
-                request.state.session_context = SessionContext()
-        except Exception as e:
-            logger.warning(f"Session validation error for path {path}: {e}")
-            request.state.session_context = SessionContext()
-
-        return await call_next(request)
-
-    except Exception as e:
-        logger.error(f"Session validation error: {e}")
-        request.state.session_context = SessionContext()
-        return await call_next(request)
-
 def get_session_context(request: Request) -> SessionContext:
     """Helper function to get session context from request"""
-    return getattr(request.state, 'session_context', SessionContext())
+    session_context = getattr(request.state, 'session_context', None)
+    if session_context is None:
+        # Cache the empty context so later dependencies reuse it
+        session_context = SessionContext()
+        request.state.session_context = session_context
+    return session_context
 
 def require_valid_session(request: Request) -> SessionContext:
     """Helper function that raises error if no valid session context"""
     session_context = get_session_context(request)
     if not session_context.is_valid:
-        from app.core.exceptions import AuthenticationError
         raise AuthenticationError("Valid session required")
     return session_context
 
-async def request_logging_middleware(request: Request, call_next):
-    """Simple request logging middleware"""
-    start_time = time.time()
+class AuthContextMiddleware:
+    """
+    Resolves the session and its tenant once per request.
+    Tenant is validated by tenant_member (not based on tenant_sites).
+    Sets request.state.session_context and request.state.tenant_context for use in endpoints.
+    """
+    def __init__(self, app: ASGIApp):
+        self.app = app
 
-    method = request.method
-    path = request.url.path
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope['type'] != 'http':
+            return await self.app(scope, receive, send)
 
-    tenant_name = getattr(getattr(request.state, 'tenant_context', None), 'tenant_name', 'unknown')
-    session_context = getattr(request.state, 'session_context', None)
-    user_id = getattr(session_context, 'user_id', 'anonymous') if session_context else 'anonymous'
+        path = scope['path']
+        needs_tenant = not (path in TENANT_SKIP_PATHS or path.startswith(TENANT_SKIP_PREFIXES))
+        needs_session = not (path == '/' or path.startswith(SESSION_PUBLIC_PREFIXES))
+
+        if not (needs_tenant or needs_session):
+            # Health checks, docs, public endpoints: the context getters
+            # fall back to empty contexts
+            return await self.app(scope, receive, send)
+
+        session_data = await self._load_session(scope)
+
+        tenant_data = session_data.get('tenant') if session_data and needs_tenant else None
+        if tenant_data:
+            logger.debug("auth_context_middleware: found session for tenant_id=%s, tenant_name=%s", tenant_data['tenant_id'], tenant_data['tenant_name'])
+
+        state = scope.setdefault('state', {})
+        state['session_context'] = SessionContext(session_data if needs_session else None)
+        _set_tenant_state(state, TenantContext(tenant_data))
+        await self.app(scope, receive, send)
+
+    async def _load_session(self, scope: Scope) -> Optional[Dict[str, Any]]:
+        logger.debug("auth_context_middleware: path=%s", scope['path'])
+        try:
+            return await get_session_from_request(Request(scope))
+        except Exception as e:
+            logger.warning("Session validation error for path %s: %s", scope['path'], e)
+            return None
+
+class RequestLoggingMiddleware:
+    """Simple request logging middleware"""
+    def __init__(self, app: ASGIApp):
+        self.app = app
 
-    response = await call_next(request)
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope['type'] != 'http' or not logger.isEnabledFor(logging.INFO):
+            return await self.app(scope, receive, send)
 
-    duration = round((time.time() - start_time) * 1000, 2)
+        start_ns = time.perf_counter_ns()
 
-    from datetime import datetime
-    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"{timestamp} | {method} {path} | {duration}ms")
+        await self.app(scope, receive, send)
 
-    return response
+        # Timestamp comes from the log formatter
+        logger.info("%s %s | %sms", scope['method'], scope['path'], (time.perf_counter_ns() - start_ns) // 1_000_000)
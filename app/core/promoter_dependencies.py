@@ -5,6 +5,7 @@ Provides RBAC (Role-Based Access Control) for the promoter commission system.
 
 from fastapi import HTTPException, Request
 from app.database import get_db_connection
+from app.core.cache import TTLCache
 from typing import Optional
 import logging
 
@@ -13,6 +14,64 @@ logger = logging.getLogger(__name__)
 # Roles permitidos para acceder a módulo de promotores
 ALLOWED_PROMOTER_ROLES = ['superuser', 'admin', 'promotor']
 
+# Constant IN list so Postgres plans the role filter against literals
+_ALLOWED_ROLES_SQL = ", ".join(f"'{role}'" for role in ALLOWED_PROMOTER_ROLES)
+
+# (user_id, tenant_id) -> granted access; cleared whenever member roles change
+promoter_access_cache = TTLCache(ttl=60)
+
+
+async def _load_promoter_access(user_id, tenant_id) -> dict:
+    """Resolve the member's promoter role; raises 403 when it has none"""
+    async with get_db_connection(use_transaction=False) as conn:
+        # tenant_member y su rol en tenant_member_roles (nuevo sistema) en un solo round-trip
+        member = await conn.fetchrow(f"""
+            SELECT tm.id, tm.role, tmr.site_role_name
+            FROM tenant_members tm
+            LEFT JOIN tenant_member_roles tmr
+                ON tmr.tenant_member_id = tm.id
+               AND tmr.is_active = true
+               AND tmr.site_role_name IN ({_ALLOWED_ROLES_SQL})
+            WHERE tm.user_id = $1 AND tm.tenant_id = $2
+            LIMIT 1
+        """, user_id, tenant_id)
+
+    if not member:
+        raise HTTPException(
+            status_code=403,
+            detail="Not a member of this tenant"
+        )
+
+    # Si no existe en tenant_member_roles, usar tenant_members.role (legacy)
+    if member['site_role_name']:
+        role = member['site_role_name']
+        logger.info(
+            "Promoter access granted for user %s (role from tenant_member_roles: %s)",
+            user_id, role
+        )
+    elif member['role'] and member['role'] in ALLOWED_PROMOTER_ROLES:
+        role = member['role']
+        logger.info(
+            "Promoter access granted for user %s (role from tenant_members.role: %s)",
+            user_id, role
+        )
+    else:
+        logger.warning(
+            "Access denied for user %s to promoter module. Required roles: %s",
+            user_id, ALLOWED_PROMOTER_ROLES
+        )
+        raise HTTPException(
+            status_code=403,
+            detail=f"Access denied. Required roles: {', '.join(ALLOWED_PROMOTER_ROLES)}"
+        )
+
+    return {
+        'tenant_member_id': member['id'],
+        'tenant_id': tenant_id,
+        'user_id': user_id,
+        'role': role
+    }
+
 
 async def require_promoter_access(request: Request) -> dict:
     """
@@ -41,56 +100,12 @@ async def require_promoter_access(request: Request) -> dict:
     if not user_id or not tenant_id:
         raise HTTPException(status_code=401, detail="Authentication required")
 
-    async with get_db_connection(use_transaction=False) as conn:
-        # Buscar tenant_member
-        member = await conn.fetchrow("""
-            SELECT id, role FROM tenant_members
-            WHERE user_id = $1 AND tenant_id = $2
-        """, user_id, tenant_id)
+    cache_key = (str(user_id), str(tenant_id))
+    access = await promoter_access_cache.get_or_load(
+        cache_key, lambda: _load_promoter_access(user_id, tenant_id)
+    )
 
-        if not member:
-            raise HTTPException(
-                status_code=403,
-                detail="Not a member of this tenant"
-            )
-
-        # Intentar obtener rol de tenant_member_roles (nuevo sistema)
-        member_role = await conn.fetchrow("""
-            SELECT * FROM tenant_member_roles
-            WHERE tenant_member_id = $1
-              AND is_active = true
-              AND site_role_name = ANY($2::text[])
-        """, member['id'], ALLOWED_PROMOTER_ROLES)
-
-        # Si no existe en tenant_member_roles, usar tenant_members.role (legacy)
-        if member_role:
-            role = member_role['site_role_name']
-            logger.info(
-                f"Promoter access granted for user {user_id} "
-                f"(role from tenant_member_roles: {role})"
-            )
-        elif member['role'] and member['role'] in ALLOWED_PROMOTER_ROLES:
-            role = member['role']
-            logger.info(
-                f"Promoter access granted for user {user_id} "
-                f"(role from tenant_members.role: {role})"
-            )
-        else:
-            logger.warning(
-                f"Access denied for user {user_id} to promoter module. "
-                f"Required roles: {ALLOWED_PROMOTER_ROLES}"
-            )
-            raise HTTPException(
-                status_code=403,
-                detail=f"Access denied. Required roles: {', '.join(ALLOWED_PROMOTER_ROLES)}"
-            )
-
-        return {
-            'tenant_member_id': member['id'],
-            'tenant_id': tenant_id,
-            'user_id': user_id,
-            'role': role
-        }
+    return dict(access)
 
 
 async def get_promoter_access_optional(request: Request) -> Optional[dict]:
@@ -122,8 +137,8 @@ async def require_admin_role(request: Request) -> dict:
 
     if access['role'] not in ['admin', 'superuser']:
         logger.warning(
-            f"Admin access denied for user {access['user_id']} "
-            f"(current role: {access['role']})"
+            "Admin access denied for user %s (current role: %s)",
+            access['user_id'], access['role']
         )
         raise HTTPException(
             status_code=403,
@@ -1,60 +1,122 @@
 import jwt
 import logging
-from datetime import datetime
+import time
+import uuid
 from fastapi import Request, HTTPException, Response
 from app.config import settings
+from app.core.cache import TTLCache
 from typing import Optional
 
 logger = logging.getLogger(__name__)
 
-async def get_session_token(request: Request) -> str:
-    """Extract valid session-token from cookies"""
+# Session token -> session payload, so repeated requests skip the DB.
+# Entries never outlive the session; dropped on sign-out / tenant switch.
+SESSION_CACHE_TTL = 30
+session_cache = TTLCache(ttl=SESSION_CACHE_TTL)
+
+# Tokens seen since the last flush; last_activity_at is written in one batched
+# UPDATE by app.tasks.session_activity instead of once per request
+_pending_activity: set = set()
+
+def touch_session(session_token: str):
+    """Mark a session as active; persisted by flush_session_activity()"""
+    _pending_activity.add(session_token)
+
+async def flush_session_activity() -> int:
+    """Write last_activity_at = NOW() for every session touched since the last flush"""
     from app.database import get_db_connection
 
-    cookie_header = request.headers.get("cookie", "")
-    session_tokens = []
+    if not _pending_activity:
+        return 0
+
+    tokens = list(_pending_activity)
+    _pending_activity.clear()
 
-    if cookie_header:
-        for cookie_pair in cookie_header.split(";"):
-            cookie_pair = cookie_pair.strip()
-            if cookie_pair.startswith("session-token="):
-                token = cookie_pair.split("=", 1)[1]
+    try:
+        async with get_db_connection(use_transaction=False) as conn:
+            await conn.execute("""
+                UPDATE sessions
+                SET last_activity_at = NOW()
+                WHERE id = ANY($1)
+            """, tokens)
+    except Exception:
+        # Keep the batch for the next flush instead of dropping it
+        _pending_activity.update(tokens)
+        raise
+
+    return len(tokens)
+
+def _parse_session_tokens(cookie_header: str) -> list:
+    """
+    All session-token values in a Cookie header (browsers may send duplicates).
+    Walks the header with find() instead of splitting every cookie pair.
+    """
+    session_tokens = []
+    pos = 0
+    length = len(cookie_header)
+
+    while pos < length:
+        end = cookie_header.find(";", pos)
+        if end == -1:
+            end = length
+        eq = cookie_header.find("=", pos, end)
+        if eq != -1 and cookie_header[pos:eq].strip() == "session-token":
+            token = cookie_header[eq + 1:end].strip()
+            if token:
                 session_tokens.append(token)
+        pos = end + 1
+
+    return session_tokens
+
+def _session_cookie_tokens(request: Request) -> list:
+    """Session tokens from the raw Cookie header (skips Starlette's full cookie parse)"""
+    cookie_header = request.headers.get("cookie")
+    return _parse_session_tokens(cookie_header) if cookie_header else []
+
+async def get_session_token(request: Request) -> str:
+    """Extract valid session-token from cookies"""
+    from app.database import get_db_connection
+
+    session_tokens = _session_cookie_tokens(request)
 
     if not session_tokens:
-        session_token = request.cookies.get("session-token")
-        if not session_token:
-            raise HTTPException(status_code=401, detail="No session found")
-        return session_token
+        raise HTTPException(status_code=401, detail="No session found")
 
-    valid_token = None
-    invalid_tokens = []
+    # Session ids are UUIDs; anything else can't match and would break the array bind
+    candidates = {}
+    for token in session_tokens:
+        try:
+            candidates[token] = str(uuid.UUID(token))
+        except ValueError:
+            continue
 
-    async with get_db_connection() as conn:
-        for token in session_tokens:
-            try:
-                session_query = """
-                    SELECT id FROM sessions
-                    WHERE id = $1 AND expires_at > NOW() AND is_active = true
-                    LIMIT 1
-                """
-                session_result = await conn.fetchrow(session_query, token)
-
-                if session_result:
-                    valid_token = token
-                    break
-                else:
-                    invalid_tokens.append(token)
-            except Exception:
-                invalid_tokens.append(token)
-
-        if invalid_tokens:
-            for invalid_token in invalid_tokens:
+    valid_token = None
+    if candidates:
+        async with get_db_connection(use_transaction=False) as conn:
+            rows = await conn.fetch("""
+                SELECT id FROM sessions
+                WHERE id = ANY($1) AND expires_at > NOW() AND is_active = true
+            """, list(candidates))
+            valid_ids = {str(row['id']) for row in rows}
+
+            # First valid token in cookie order wins; the rest are stale duplicates
+            valid_token = next((t for t, key in candidates.items() if key in valid_ids), None)
+            invalid_tokens = [t for t, key in candidates.items() if key not in valid_ids]
+
+            if invalid_tokens:
                 try:
-                    await conn.execute(
-                        "UPDATE sessions SET is_active = false WHERE id = $1",
-                        invalid_token
-                    )
+                    # Stamp ended_at/end_reason here so expired sessions are
+                    # closed out without a separate per-request check
+                    await conn.execute("""
+                        UPDATE sessions
+                        SET is_active = false,
+                            ended_at = COALESCE(ended_at, NOW()),
+                            end_reason = COALESCE(
+                                end_reason,
+                                CASE WHEN expires_at <= NOW() THEN 'expired' ELSE 'invalidated' END
+                            )
+                        WHERE id = ANY($1)
+                    """, invalid_tokens)
                 except Exception:
                     pass
 
@@ -63,6 +125,27 @@ async def get_session_token(request: Request) -> str:
 
     return valid_token
 
+async def _session_cookie_domain(session_token: str) -> Optional[str]:
+    """Cookie domain for the session's tenant site; cached sessions skip the DB"""
+    cached = session_cache.get(session_token)
+    tenant = cached.get('tenant') if cached else None
+    if tenant and tenant['site']:
+        return f".{tenant['site']}"
+
+    from app.database import get_db_connection
+    async with get_db_connection(use_transaction=False) as conn:
+        site_result = await conn.fetchrow("""
+            SELECT ts.site
+            FROM sessions s
+            JOIN tenant_sites ts ON s.tenant_id = ts.tenant_id
+            WHERE s.id = $1 AND s.is_active = true AND ts.is_active = true
+            LIMIT 1
+        """, session_token)
+
+    if site_result and site_result['site']:
+        return f".{site_result['site']}"
+    return None
+
 async def set_session_cookie(response: Response, session_token: str, tenant_site: str = None):
     """Set session cookie with correct domain for the tenant"""
     cookie_domain = None
@@ -71,21 +154,9 @@ async def set_session_cookie(response: Response, session_token: str, tenant_site
             cookie_domain = f".{tenant_site}"
         else:
             try:
-                from app.database import get_db_connection
-                async with get_db_connection(use_transaction=False) as conn:
-                    site_query = """
-                        SELECT ts.site
-                        FROM sessions s
-                        JOIN tenant_sites ts ON s.tenant_id = ts.tenant_id
-                        WHERE s.id = $1 AND s.is_active = true AND ts.is_active = true
-                        LIMIT 1
-                    """
-                    site_result = await conn.fetchrow(site_query, session_token)
-
-                    if site_result and site_result['site']:
-                        cookie_domain = f".{site_result['site']}"
+                cookie_domain = await _session_cookie_domain(session_token)
             except Exception as e:
-                logger.warning(f"Error getting site from DB: {e}")
+                logger.warning("Error getting site from DB: %s", e)
 
     response.delete_cookie("session-token", domain=cookie_domain)
     if cookie_domain:
@@ -102,25 +173,15 @@ async def set_session_cookie(response: Response, session_token: str, tenant_site
         path="/"
     )
 
-async def clear_session_cookie(response: Response, session_token: str = None):
+async def clear_session_cookie(response: Response, session_token: str = None, tenant_site: str = None):
     """Clear session cookie with dynamic domain from database"""
     cookie_domain = None
 
-    if session_token and not settings.is_development:
+    if tenant_site and not settings.is_development:
+        cookie_domain = f".{tenant_site}"
+    elif session_token and not settings.is_development:
         try:
-            from app.database import get_db_connection
-            async with get_db_connection(use_transaction=False) as conn:
-                site_query = """
-                    SELECT ts.site
-                    FROM sessions s
-                    JOIN tenant_sites ts ON s.tenant_id = ts.tenant_id
-                    WHERE s.id = $1 AND s.is_active = true AND ts.is_active = true
-                    LIMIT 1
-                """
-                site_result = await conn.fetchrow(site_query, session_token)
-
-                if site_result and site_result['site']:
-                    cookie_domain = f".{site_result['site']}"
+            cookie_domain = await _session_cookie_domain(session_token)
         except Exception:
             pass
 
@@ -128,22 +189,44 @@ async def clear_session_cookie(response: Response, session_token: str = None):
     if cookie_domain:
         response.delete_cookie("session-token", path="/")
 
+JWT_SESSION_LIFETIME_SECONDS = 30 * 24 * 60 * 60  # 30 days
+
 def create_session_token(user_id: str, email: str) -> str:
     """Create a JWT session token"""
-    from datetime import timedelta
+    # Integer epoch claims: PyJWT skips its datetime conversion, and iat/exp
+    # come from a single clock read
+    issued_at = int(time.time())
     payload = {
         "user_id": user_id,
         "email": email,
-        "iat": datetime.utcnow(),
-        "exp": datetime.utcnow() + timedelta(days=30)
+        "iat": issued_at,
+        "exp": issued_at + JWT_SESSION_LIFETIME_SECONDS
     }
     return jwt.encode(payload, settings.jwt_secret, algorithm="HS256")
 
 
+# Raw JWT -> decoded payload; only successfully verified tokens are cached
+JWT_CACHE_TTL = 300
+jwt_cache = TTLCache(ttl=JWT_CACHE_TTL)
+
+def _decode_jwt(token: str) -> dict:
+    """jwt.decode with a per-token cache; entries never outlive the token's exp"""
+    payload = jwt_cache.get(token)
+    if payload is None:
+        payload = jwt.decode(token, settings.jwt_secret, algorithms=["HS256"])
+        remaining = payload["exp"] - time.time() if "exp" in payload else JWT_CACHE_TTL
+        jwt_cache.set(token, payload, ttl=min(JWT_CACHE_TTL, remaining))
+    return payload
+
+def invalidate_token(token: str):
+    """Drop a JWT from the verification cache (e.g. on logout)"""
+    jwt_cache.pop(token)
+
+
 def verify_session_token(token: str) -> Optional[dict]:
     """Verify a JWT session token and return payload"""
     try:
-        payload = jwt.decode(token, settings.jwt_secret, algorithms=["HS256"])
+        payload = _decode_jwt(token)
         return {
             "user_id": payload.get("user_id"),
             "email": payload.get("email")
@@ -157,12 +240,7 @@ def verify_session_token(token: str) -> Optional[dict]:
 def validate_jwt_token(token: str) -> dict:
     """Validate JWT token"""
     try:
-        payload = jwt.decode(
-            token,
-            settings.jwt_secret,
-            algorithms=["HS256"]
-        )
-        return payload
+        return dict(_decode_jwt(token))
     except jwt.ExpiredSignatureError:
         raise HTTPException(status_code=401, detail="Token expired")
     except jwt.InvalidTokenError:
@@ -172,26 +250,56 @@ def get_client_ip(request: Request) -> Optional[str]:
     """Get client IP address from request headers"""
     forwarded_for = request.headers.get('x-forwarded-for')
     if forwarded_for:
-        return forwarded_for.split(',')[0].strip()
+        return forwarded_for.partition(',')[0].strip()
     return request.client.host if request.client else None
 
+# Raw (lowercase) header name -> detect_tenant_from_headers key
+_TENANT_HEADERS = {
+    b'host': 'host',
+    b'origin': 'origin',
+    b'referer': 'referer',
+    b'x-forwarded-host': 'forwarded_host',
+    b'x-original-host': 'original_host',
+}
+
 def detect_tenant_from_headers(request: Request) -> dict:
-    """Extract tenant detection headers"""
+    """Extract tenant detection headers in a single pass over the raw headers"""
+    result = dict.fromkeys(_TENANT_HEADERS.values(), '')
+    for name, value in request.headers.raw:
+        key = _TENANT_HEADERS.get(name)
+        # First occurrence wins, like Headers.get()
+        if key is not None and not result[key]:
+            result[key] = value.decode('latin-1')
+    return result
+
+def _session_tenant(row) -> Optional[dict]:
+    """Tenant payload for TenantContext, or None when the user is no longer a member"""
+    if row['member_tenant_id'] is None:
+        return None
     return {
-        'host': request.headers.get('host', ''),
-        'origin': request.headers.get('origin', ''),
-        'referer': request.headers.get('referer', ''),
-        'forwarded_host': request.headers.get('x-forwarded-host', ''),
-        'original_host': request.headers.get('x-original-host', ''),
+        'tenant_id': row['member_tenant_id'],
+        'tenant_name': row['tenant_name'],
+        'tenant_slug': row['tenant_slug'],
+        'tenant_email': row['tenant_email'],
+        'site': row['site'],
+        'brand_name': row['brand_name'] if row['site_found'] else row['tenant_name'],
+        'is_active': True
     }
 
 async def get_session_from_request(request: Request) -> Optional[dict]:
     """
     Get session data from request using session token.
-    Returns session data with user_id, tenant_id, etc.
+    Returns session data with user_id, tenant_id, etc. plus the resolved
+    'tenant' payload (None if the user is not a member of the session tenant).
     """
     from app.database import get_db_connection
 
+    for token in _session_cookie_tokens(request):
+        cached = session_cache.get(token)
+        if cached is not None:
+            touch_session(token)
+            return cached
+
     try:
         try:
             session_token = await get_session_token(request)
@@ -201,34 +309,28 @@ async def get_session_from_request(request: Request) -> Optional[dict]:
         if not session_token:
             return None
 
-        async with get_db_connection() as conn:
-            session_check = await conn.fetchrow("""
-                SELECT id, expires_at, is_active, ended_at
-                FROM sessions
-                WHERE id = $1
-            """, session_token)
-
-            if session_check:
-                is_expired = session_check['expires_at'] < datetime.now(session_check['expires_at'].tzinfo)
-                is_inactive = not session_check['is_active']
-
-                if is_expired or is_inactive:
-                    if session_check['ended_at'] is None:
-                        end_reason = 'expired' if is_expired else 'invalidated'
-                        await conn.execute("""
-                            UPDATE sessions
-                            SET is_active = false,
-                                ended_at = NOW(),
-                                end_reason = $2
-                            WHERE id = $1 AND ended_at IS NULL
-                        """, session_token, end_reason)
-                    return None
-
+        async with get_db_connection(use_transaction=False) as conn:
+            # Session, profile and the session's tenant (only when the user is
+            # still a member, plus its active site) in one round-trip
             session_query = """
                 SELECT s.user_id, s.tenant_id, s.expires_at, s.is_active,
-                       p.email, p.name
+                       p.email, p.name,
+                       t.id as member_tenant_id, t.name as tenant_name,
+                       t.slug as tenant_slug, t.email as tenant_email,
+                       ts.site, ts.brand_name, ts.site_found
                 FROM sessions s
                 JOIN profile p ON s.user_id = p.id
+                LEFT JOIN tenants t ON t.id = s.tenant_id
+                    AND EXISTS (
+                        SELECT 1 FROM tenant_members tm
+                        WHERE tm.tenant_id = t.id AND tm.user_id = s.user_id
+                    )
+                LEFT JOIN LATERAL (
+                    SELECT site, brand_name, true AS site_found
+                    FROM tenant_sites
+                    WHERE tenant_id = t.id AND is_active = true
+                    LIMIT 1
+                ) ts ON true
                 WHERE s.id = $1
                   AND s.expires_at > NOW()
                   AND s.is_active = true
@@ -239,23 +341,26 @@ async def get_session_from_request(request: Request) -> Optional[dict]:
             if not session_result:
                 return None
 
-            await conn.execute("""
-                UPDATE sessions
-                SET last_activity_at = NOW()
-                WHERE id = $1
-            """, session_token)
+            touch_session(session_token)
 
-            return {
+            session_data = {
                 'user_id': session_result['user_id'],
                 'tenant_id': session_result['tenant_id'],
                 'email': session_result['email'],
                 'name': session_result['name'],
                 'expires_at': session_result['expires_at'],
-                'is_active': session_result['is_active']
+                'is_active': session_result['is_active'],
+                'tenant': _session_tenant(session_result)
             }
 
+            expires_at = session_result['expires_at']
+            remaining = expires_at.timestamp() - time.time()
+            session_cache.set(session_token, session_data, ttl=min(SESSION_CACHE_TTL, remaining))
+
+            return session_data
+
     except Exception as e:
-        logger.error(f"Error in get_session_from_request: {e}", exc_info=True)
+        logger.error("Error in get_session_from_request: %s", e, exc_info=True)
         return None
 
 async def get_current_user_id(request: Request) -> Optional[str]:
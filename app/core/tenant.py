@@ -2,8 +2,25 @@ from fastapi import Request, HTTPException
 from app.database import get_db_connection
 from app.core.security import detect_tenant_from_headers
 from app.config import settings
-import json
+from app.core.cache import TTLCache
+import orjson
 from pathlib import Path
+from functools import lru_cache
+
+# Candidate sites (in header priority order) -> validated site
+_site_cache = TTLCache(ttl=300, maxsize=1024)
+
+@lru_cache(maxsize=1024)
+def _url_host(url: str) -> str:
+    """Return the host[:port] part of an Origin/Referer value without a full urlparse"""
+    start = url.find('//')
+    start = start + 2 if start != -1 else 0
+    end = len(url)
+    for sep in '/?#':
+        pos = url.find(sep, start)
+        if pos != -1 and pos < end:
+            end = pos
+    return url[start:end]
 
 async def detect_and_validate_tenant(request: Request) -> str:
     """
@@ -18,12 +35,12 @@ async def detect_and_validate_tenant(request: Request) -> str:
         try:
             mapping_path = Path("dev-site-mapping.json")
             if mapping_path.exists():
-                dev_site_mapping = json.loads(mapping_path.read_text())
+                dev_site_mapping = orjson.loads(mapping_path.read_bytes())
 
                 if headers['forwarded_host'] and headers['forwarded_host'] in dev_site_mapping:
                     potential_sites = [dev_site_mapping[headers['forwarded_host']]]
                 else:
-                    backend_port = headers['host'].split(':')[1] if ':' in headers['host'] else '8001'
+                    backend_port = headers['host'].partition(':')[2] or '8001'
                     backend_host = f"localhost:{backend_port}"
 
                     if backend_host in dev_site_mapping:
@@ -35,20 +52,30 @@ async def detect_and_validate_tenant(request: Request) -> str:
         potential_sites = [
             headers['forwarded_host'],
             headers['original_host'],
-            headers['origin'].replace('https://', '').replace('http://', '') if headers['origin'] else None,
-            headers['referer'].replace('https://', '').replace('http://', '').split('/')[0] if headers['referer'] else None,
+            _url_host(headers['origin']) if headers['origin'] else None,
+            _url_host(headers['referer']) if headers['referer'] else None,
             headers['host']
         ]
 
     potential_sites = [site for site in potential_sites if site]
 
-    async with get_db_connection() as conn:
-        for site in potential_sites:
-            result = await conn.fetchrow(
-                "SELECT site FROM tenant_sites WHERE site = $1 AND is_active = true",
-                site
+    cache_key = tuple(potential_sites)
+    site = _site_cache.get(cache_key)
+    if site is not None:
+        return site
+
+    if potential_sites:
+        async with get_db_connection(use_transaction=False) as conn:
+            rows = await conn.fetch(
+                "SELECT site FROM tenant_sites WHERE site = ANY($1::text[]) AND is_active = true",
+                potential_sites
             )
-            if result:
+        active_sites = {row['site'] for row in rows}
+
+        # Keep the header priority order: first candidate with an active site wins
+        for site in potential_sites:
+            if site in active_sites:
+                _site_cache.set(cache_key, site)
                 return site
 
     raise HTTPException(
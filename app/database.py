@@ -1,5 +1,5 @@
 import asyncpg
-import json
+import orjson
 from contextlib import asynccontextmanager
 from app.config import settings
 import logging
@@ -7,34 +7,56 @@ import logging
 logger = logging.getLogger(__name__)
 
 
+def _jsonb_encode(value) -> str:
+    # OPT_NON_STR_KEYS keeps json.dumps' int-key behaviour
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
 async def _init_connection(conn):
     """Register jsonb codec so all jsonb columns are decoded as Python dicts automatically."""
     await conn.set_type_codec(
         'jsonb',
-        encoder=json.dumps,
-        decoder=json.loads,
+        encoder=_jsonb_encode,
+        decoder=orjson.loads,
         schema='pg_catalog'
     )
 
 
 class DatabasePool:
+    # Transactional work (use_transaction=True)
     _pool = None
+    # Autocommit statements (use_transaction=False), kept apart so they don't
+    # queue behind long transactions
+    _autocommit_pool = None
+
+    @staticmethod
+    async def _open(min_size: int, max_size: int):
+        return await asyncpg.create_pool(
+            **settings.db_connection_params,
+            min_size=min_size,
+            max_size=max_size,
+            max_queries=50000,
+            max_inactive_connection_lifetime=300,
+            command_timeout=60,
+            timeout=30,
+            statement_cache_size=settings.db_statement_cache_size,
+            init=_init_connection
+        )
 
     @classmethod
     async def create_pool(cls):
         if cls._pool is None:
             try:
-                cls._pool = await asyncpg.create_pool(
-                    **settings.db_connection_params,
-                    min_size=5,
-                    max_size=30,
-                    max_queries=50000,
-                    max_inactive_connection_lifetime=300,
-                    command_timeout=60,
-                    timeout=30,
-                    init=_init_connection
-                )
-                logger.info(f"Database pool created: {settings.db_name}@{settings.db_host}")
+                pool = await cls._open(settings.db_pool_min_size, settings.db_pool_max_size)
+                try:
+                    autocommit_pool = await cls._open(
+                        settings.db_autocommit_pool_min_size, settings.db_autocommit_pool_max_size
+                    )
+                except Exception:
+                    await pool.close()
+                    raise
+                cls._pool, cls._autocommit_pool = pool, autocommit_pool
+                logger.info(f"Database pools created: {settings.db_name}@{settings.db_host}")
             except Exception as e:
                 logger.error(f"Failed to create database pool: {e}")
                 raise
@@ -44,8 +66,10 @@ class DatabasePool:
     async def close_pool(cls):
         if cls._pool:
             await cls._pool.close()
+            await cls._autocommit_pool.close()
             cls._pool = None
-            logger.info("Database pool closed")
+            cls._autocommit_pool = None
+            logger.info("Database pools closed")
 
 @asynccontextmanager
 async def get_db_connection(use_transaction: bool = True):
@@ -64,7 +88,11 @@ async def get_db_connection(use_transaction: bool = True):
     async with get_db_connection(use_transaction=False) as conn:
         result = await conn.fetchrow("SELECT * FROM table WHERE id = $1", id)
     """
-    pool = await DatabasePool.create_pool()
+    # The lifespan handler creates the pools at startup; the fallback only
+    # covers scripts/tests that use the DB without running the app
+    if DatabasePool._pool is None:
+        await DatabasePool.create_pool()
+    pool = DatabasePool._pool if use_transaction else DatabasePool._autocommit_pool
     async with pool.acquire() as connection:
         if use_transaction:
             async with connection.transaction():
@@ -1,11 +1,12 @@
 import asyncio
 from contextlib import asynccontextmanager
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from app.config import settings
 from app.core.logging import setup_logging
 from app.core.exceptions import api_exception_handler, general_exception_handler, APIError
-from app.core.middleware import tenant_detection_middleware, session_validation_middleware, request_logging_middleware
+from app.core.middleware import AuthContextMiddleware, RequestLoggingMiddleware
 
 # Initialize logging
 setup_logging()
@@ -16,16 +17,21 @@ async def lifespan(app: FastAPI):
     """Manage application lifecycle - startup and shutdown"""
     from app.database import DatabasePool
     from app.tasks.cleanup import run_cleanup_loop
+    from app.tasks.session_activity import run_session_activity_loop
     await DatabasePool.create_pool()
-    cleanup_task = asyncio.create_task(run_cleanup_loop())
+    background_tasks = [
+        asyncio.create_task(run_cleanup_loop()),
+        asyncio.create_task(run_session_activity_loop()),
+    ]
 
     yield
 
-    cleanup_task.cancel()
-    try:
-        await cleanup_task
-    except asyncio.CancelledError:
-        pass
+    for task in background_tasks:
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
     await DatabasePool.close_pool()
 
 
@@ -36,12 +42,27 @@ app = FastAPI(
     debug=settings.debug,
     docs_url="/docs",
     redirect_slashes=True,
+    default_response_class=ORJSONResponse,
     lifespan=lifespan
 )
 
 # Configure cookie authentication for Swagger UI
 from fastapi.openapi.utils import get_openapi
 
+# Public endpoints (no auth required) in the OpenAPI docs
+OPENAPI_PUBLIC_ENDPOINTS = frozenset({
+    "/auth/sign-in-magic-link",
+    "/auth/verify-code",
+    "/auth/verify",
+    "/health",
+    "/",
+})
+
+# Public prefixes
+OPENAPI_PUBLIC_PREFIXES = ("/public", "/webhooks", "/cart")
+
+OPENAPI_AUTH_METHODS = frozenset({"get", "post", "put", "delete", "patch"})
+
 def custom_openapi():
     if app.openapi_schema:
         return app.openapi_schema
@@ -59,27 +80,13 @@ def custom_openapi():
         }
     }
 
-    # Public endpoints (no auth required)
-    public_endpoints = [
-        "/auth/sign-in-magic-link",
-        "/auth/verify-code",
-        "/auth/verify",
-        "/health",
-        "/",
-    ]
-
-    # Public prefixes
-    public_prefixes = ["/public", "/webhooks", "/cart"]
-
-    for path in openapi_schema["paths"]:
-        if path in public_endpoints:
-            continue
-        if any(path.startswith(prefix) for prefix in public_prefixes):
+    for path, operations in openapi_schema["paths"].items():
+        if path in OPENAPI_PUBLIC_ENDPOINTS or path.startswith(OPENAPI_PUBLIC_PREFIXES):
             continue
 
-        for method in openapi_schema["paths"][path]:
-            if method in ["get", "post", "put", "delete", "patch"]:
-                openapi_schema["paths"][path][method]["security"] = [{"cookieAuth": []}]
+        for method, operation in operations.items():
+            if method in OPENAPI_AUTH_METHODS:
+                operation["security"] = [{"cookieAuth": []}]
 
     app.openapi_schema = openapi_schema
     return app.openapi_schema
@@ -93,17 +100,16 @@ app.add_exception_handler(Exception, general_exception_handler)
 # CORS middleware
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=settings.cors_origins.split(","),
+    allow_origins=settings.cors_origins_list,
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
 )
 
 # Custom middleware (order matters - first added runs last)
-# Execution order: tenant_detection → session_validation → logging
-app.middleware("http")(request_logging_middleware)   # runs last
-app.middleware("http")(session_validation_middleware) # runs second
-app.middleware("http")(tenant_detection_middleware)   # runs first
+# Execution order: auth_context → logging
+app.add_middleware(RequestLoggingMiddleware)  # runs last
+app.add_middleware(AuthContextMiddleware)     # runs first
 
 # Import and include routers
 from app.routers import (
@@ -1,12 +1,12 @@
 # Models module for WaRo Tickets API
 from app.models.event import (
     Event, EventCreate, EventUpdate, EventSummary,
-    EventImage, EventImageCreate, EventPublic, EventWithAreas,
+    ClusterImage, ClusterImageCreate, EventPublic, EventWithAreas,
     LegalInfo, LegalInfoCreate, EventType, EventStatus
 )
 from app.models.event_image import (
-    EventImage as NewEventImage,
-    EventImageCreate as NewEventImageCreate,
+    EventImage,
+    EventImageCreate,
     EventImageUpdate,
     EventImageSummary,
     ImageType
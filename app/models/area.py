@@ -1,4 +1,4 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, ConfigDict
 from typing import Optional, List
 from datetime import datetime
 from decimal import Decimal
@@ -65,8 +65,7 @@ class Area(AreaBase):
     units_reserved: Optional[int] = None
     units_sold: Optional[int] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class AreaSummary(BaseModel):
@@ -86,8 +85,7 @@ class AreaSummary(BaseModel):
     current_price: Optional[Decimal] = None
     active_sale_stage: Optional[str] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class AreaWithUnits(Area):
@@ -1,4 +1,4 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, ConfigDict
 from typing import Optional
 from datetime import datetime
 from decimal import Decimal
@@ -62,8 +62,7 @@ class AreaPromotion(AreaPromotionBase):
     area_name: Optional[str] = None
     cluster_id: Optional[int] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class AreaPromotionSummary(BaseModel):
@@ -80,8 +79,7 @@ class AreaPromotionSummary(BaseModel):
     is_active: bool
     is_currently_valid: bool
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class PromotionValidation(BaseModel):
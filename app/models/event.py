@@ -1,4 +1,4 @@
-from pydantic import BaseModel, Field, model_validator
+from pydantic import BaseModel, Field, model_validator, ConfigDict
 from typing import Optional, List, Any
 from datetime import datetime, timezone
 from enum import Enum
@@ -92,8 +92,8 @@ class EventUpdate(BaseModel):
         return self
 
 
-class EventImage(BaseModel):
-    """Schema para imagenes de evento"""
+class ClusterImage(BaseModel):
+    """Schema para imagenes de evento (tabla cluster_images)"""
     id: int
     cluster_id: int
     image_id: str
@@ -102,8 +102,8 @@ class EventImage(BaseModel):
     image_url: Optional[str] = None
 
 
-class EventImageCreate(BaseModel):
-    """Schema para agregar imagen a evento"""
+class ClusterImageCreate(BaseModel):
+    """Schema para agregar imagen a evento (tabla cluster_images)"""
     image_id: str
     type_image: str = Field(..., description="Tipo: cover, banner, thumbnail, gallery")
 
@@ -121,13 +121,12 @@ class Event(EventBase):
     updated_at: datetime
 
     # Campos calculados/relacionados
-    images: List[EventImage] = []
+    images: List[ClusterImage] = []
     total_capacity: Optional[int] = None
     tickets_sold: Optional[int] = None
     tickets_available: Optional[int] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class EventUpdateResponse(Event):
@@ -168,8 +167,7 @@ class EventSummary(BaseModel):
     has_promotions: bool = False
     featured_promotion: Optional[FeaturedPromotion] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 class EventWithAreas(Event):
@@ -192,8 +190,7 @@ class EventPublic(BaseModel):
     flyer_image_url: Optional[str] = None
     extra_attributes: Optional[dict] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class LegalInfo(BaseModel):
@@ -206,8 +203,7 @@ class LegalInfo(BaseModel):
     city: Optional[str] = None
     country: Optional[str] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class LegalInfoCreate(BaseModel):
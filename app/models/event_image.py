@@ -1,4 +1,4 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, ConfigDict
 from typing import Optional, Literal
 from datetime import datetime
 from enum import Enum
@@ -45,8 +45,7 @@ class EventImage(EventImageBase):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class EventImageSummary(BaseModel):
@@ -58,5 +57,4 @@ class EventImageSummary(BaseModel):
     width: Optional[int] = None
     height: Optional[int] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
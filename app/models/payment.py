@@ -1,5 +1,5 @@
-from pydantic import BaseModel, Field, EmailStr
-from typing import Optional, List, Any
+from pydantic import BaseModel, Field, EmailStr, ConfigDict
+from typing import Optional, List, Any, Callable, Dict
 from datetime import datetime
 from decimal import Decimal
 from enum import Enum
@@ -85,7 +85,69 @@ def get_payment_method_display_name(method_type: str | None) -> str:
     """
     if not method_type:
         return "Pago en línea"
-    return PAYMENT_METHOD_DISPLAY_NAMES.get(method_type.upper(), method_type)
+    # Wompi ya envía el tipo en mayúsculas; solo se normaliza si no coincide
+    display_name = PAYMENT_METHOD_DISPLAY_NAMES.get(method_type)
+    if display_name is None:
+        display_name = PAYMENT_METHOD_DISPLAY_NAMES.get(method_type.upper(), method_type)
+    return display_name
+
+
+def _card_details(method_data: dict) -> Optional[str]:
+    """Marca y últimos 4 dígitos de la tarjeta"""
+    extra = method_data.get("extra", {})
+    brand = extra.get("brand", "")
+    last_four = extra.get("last_four", "")
+    if brand and last_four:
+        return f"{brand} ****{last_four}"
+    if last_four:
+        return f"****{last_four}"
+    return None
+
+
+def _phone_details(method_data: dict) -> Optional[str]:
+    """Teléfono de la billetera (Nequi, Daviplata), parcialmente oculto por privacidad"""
+    phone = method_data.get("phone_number", "")
+    if phone:
+        return "***" + phone[-4:] if len(phone) >= 4 else phone
+    return None
+
+
+def _pse_details(method_data: dict) -> Optional[str]:
+    """Info de PSE (banco)"""
+    institution = method_data.get("financial_institution_code", "")
+    return f"Código banco: {institution}" if institution else None
+
+
+def _bancolombia_transfer_details(method_data: dict) -> Optional[str]:
+    """Tipo de persona de la transferencia Bancolombia"""
+    user_type = method_data.get("user_type")
+    if user_type is None:
+        return None
+    return "Persona natural" if user_type == 0 else "Persona jurídica"
+
+
+def _pcol_details(method_data: dict) -> Optional[str]:
+    """Puntos Colombia usados"""
+    points_used = method_data.get("points_used", 0)
+    return f"{points_used:,} puntos" if points_used else None
+
+
+def _su_plus_details(method_data: dict) -> Optional[str]:
+    """SU+ Pay - pago a cuotas"""
+    installments = method_data.get("installments") or method_data.get("extra", {}).get("installments")
+    return f"{installments} cuotas" if installments else None
+
+
+# Tipo de método (mayúsculas) -> extractor del detalle a mostrar
+PAYMENT_METHOD_DETAIL_FORMATTERS: Dict[str, Callable[[dict], Optional[str]]] = {
+    "CARD": _card_details,
+    "NEQUI": _phone_details,
+    "DAVIPLATA": _phone_details,
+    "PSE": _pse_details,
+    "BANCOLOMBIA_TRANSFER": _bancolombia_transfer_details,
+    "PCOL": _pcol_details,
+    "SU_PLUS": _su_plus_details,
+}
 
 
 def get_payment_method_details(method_type: str | None, method_data: dict | None) -> dict:
@@ -103,59 +165,12 @@ def get_payment_method_details(method_type: str | None, method_data: dict | None
         return {"display_name": "Pago en línea", "details": None}
 
     display_name = get_payment_method_display_name(method_type)
-    details = None
 
     if not method_data:
         return {"display_name": display_name, "details": None}
 
-    method_type_upper = method_type.upper()
-
-    if method_type_upper == "CARD":
-        # Extraer info de tarjeta
-        extra = method_data.get("extra", {})
-        brand = extra.get("brand", "")
-        last_four = extra.get("last_four", "")
-        if brand and last_four:
-            details = f"{brand} ****{last_four}"
-        elif last_four:
-            details = f"****{last_four}"
-
-    elif method_type_upper == "NEQUI":
-        # Extraer teléfono de Nequi
-        phone = method_data.get("phone_number", "")
-        if phone:
-            # Ocultar parte del número por privacidad
-            details = f"***{phone[-4:]}" if len(phone) >= 4 else phone
-
-    elif method_type_upper == "DAVIPLATA":
-        # Similar a Nequi
-        phone = method_data.get("phone_number", "")
-        if phone:
-            details = f"***{phone[-4:]}" if len(phone) >= 4 else phone
-
-    elif method_type_upper == "PSE":
-        # Info de PSE (banco)
-        institution = method_data.get("financial_institution_code", "")
-        if institution:
-            details = f"Código banco: {institution}"
-
-    elif method_type_upper == "BANCOLOMBIA_TRANSFER":
-        # Transferencia Bancolombia
-        user_type = method_data.get("user_type")
-        if user_type is not None:
-            details = "Persona natural" if user_type == 0 else "Persona jurídica"
-
-    elif method_type_upper == "PCOL":
-        # Puntos Colombia
-        points_used = method_data.get("points_used", 0)
-        if points_used:
-            details = f"{points_used:,} puntos"
-
-    elif method_type_upper == "SU_PLUS":
-        # SU+ Pay - pago a cuotas
-        installments = method_data.get("installments") or method_data.get("extra", {}).get("installments")
-        if installments:
-            details = f"{installments} cuotas"
+    formatter = PAYMENT_METHOD_DETAIL_FORMATTERS.get(method_type.upper())
+    details = formatter(method_data) if formatter else None
 
     return {
         "display_name": display_name,
@@ -206,8 +221,7 @@ class Payment(PaymentBase):
     gateway_name: Optional[str] = None
     gateway_order_id: Optional[str] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class PaymentSummary(BaseModel):
@@ -220,8 +234,7 @@ class PaymentSummary(BaseModel):
     payment_method: Optional[str] = None
     payment_date: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 class WompiTransactionCreate(BaseModel):
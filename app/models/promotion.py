@@ -1,4 +1,4 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, ConfigDict
 from typing import Optional, List
 from datetime import datetime
 from decimal import Decimal
@@ -75,8 +75,7 @@ class Promotion(PromotionBase):
     # Items del combo
     items: List[PromotionItemResponse] = []
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class PromotionSummary(BaseModel):
@@ -97,8 +96,7 @@ class PromotionSummary(BaseModel):
     items_count: int = 0  # Cantidad de areas diferentes
     items: List[PromotionItemResponse] = []
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class CalculatedPrice(BaseModel):
@@ -125,8 +123,7 @@ class PromotionPublic(BaseModel):
     savings: Optional[Decimal] = None
     items: List[PromotionItemResponse] = []
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 # Deprecated aliases for backwards compatibility
@@ -1,5 +1,5 @@
 from pydantic import BaseModel, Field
-from typing import Optional
+from typing import Dict, Optional
 from datetime import datetime
 from enum import Enum
 
@@ -17,6 +17,17 @@ class ValidationResult(str, Enum):
     TICKET_CANCELLED = "ticket_cancelled"
 
 
+# Mensajes fijos por resultado (los que dependen del ticket se arman en el servicio)
+VALIDATION_MESSAGES: Dict[ValidationResult, str] = {
+    ValidationResult.VALID: "Boleto valido - Acceso permitido",
+    ValidationResult.INVALID_SIGNATURE: "Codigo QR invalido o alterado",
+    ValidationResult.TICKET_NOT_FOUND: "Boleto no encontrado",
+    ValidationResult.ALREADY_USED: "Este boleto ya fue utilizado",
+    ValidationResult.TICKET_TRANSFERRED: "Este boleto fue transferido a otro usuario",
+    ValidationResult.TICKET_CANCELLED: "Este boleto fue cancelado",
+}
+
+
 class QRCodeResponse(BaseModel):
     """Respuesta con codigo QR"""
     reservation_unit_id: int
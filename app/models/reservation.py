@@ -1,9 +1,8 @@
-from pydantic import BaseModel, Field, EmailStr, field_validator
+from pydantic import BaseModel, Field, EmailStr, ConfigDict
 from typing import Optional, List, Union
 from datetime import datetime
 from decimal import Decimal
 from enum import Enum
-from uuid import UUID
 
 
 class ReservationStatus(str, Enum):
@@ -28,6 +27,7 @@ class ReservationBase(BaseModel):
     """Campos base de reservacion"""
     start_date: datetime = Field(..., description="Fecha del evento")
     end_date: datetime = Field(..., description="Fecha fin del evento")
+    # default_factory: cada instancia recibe su propio dict (no un default mutable compartido)
     extra_attributes: Optional[dict] = Field(default_factory=dict)
 
 
@@ -69,15 +69,7 @@ class ReservationUnit(BaseModel):
     base_price: Optional[Decimal] = None
     final_price: Optional[Decimal] = None
 
-    @field_validator('reservation_id', 'original_user_id', 'applied_sale_stage_id', 'applied_promotion_id', mode='before')
-    @classmethod
-    def convert_uuid_to_str(cls, v):
-        if isinstance(v, UUID):
-            return str(v)
-        return v
-
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class Reservation(ReservationBase):
@@ -104,15 +96,7 @@ class Reservation(ReservationBase):
     total: Decimal = Decimal("0")
     currency: str = "COP"
 
-    @field_validator('id', 'user_id', mode='before')
-    @classmethod
-    def convert_uuid_to_str(cls, v):
-        if isinstance(v, UUID):
-            return str(v)
-        return v
-
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class ReservationSummary(BaseModel):
@@ -127,15 +111,7 @@ class ReservationSummary(BaseModel):
     currency: str
     reservation_date: datetime
 
-    @field_validator('id', 'user_id', mode='before')
-    @classmethod
-    def convert_uuid_to_str(cls, v):
-        if isinstance(v, UUID):
-            return str(v)
-        return v
-
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class ReservationWithPayment(Reservation):
@@ -161,13 +137,6 @@ class ReservationTimeout(BaseModel):
     seconds_remaining: int
     is_expired: bool
 
-    @field_validator('reservation_id', mode='before')
-    @classmethod
-    def convert_uuid_to_str(cls, v):
-        if isinstance(v, UUID):
-            return str(v)
-        return v
-
 
 class MyTicket(BaseModel):
     """Ticket del usuario"""
@@ -186,12 +155,4 @@ class MyTicket(BaseModel):
     can_transfer: bool = True
     transferred_to_email: Optional[str] = None  # Email of recipient if transferred out
 
-    @field_validator('reservation_id', mode='before')
-    @classmethod
-    def convert_uuid_to_str(cls, v):
-        if isinstance(v, UUID):
-            return str(v)
-        return v
-
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
@@ -1,4 +1,4 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, ConfigDict
 from typing import Optional, List
 from datetime import datetime
 from decimal import Decimal
@@ -18,6 +18,13 @@ class SaleStageAreaItem(BaseModel):
     quantity: int = Field(default=1, ge=1, description="Cantidad de boletas de esta area")
 
 
+class SaleStageAreaRef(BaseModel):
+    """Area vinculada a una etapa de venta (respuesta)"""
+    id: int
+    area_name: str
+    quantity: int = 1
+
+
 class SaleStageBase(BaseModel):
     """Campos base de etapa de venta (nivel evento/cluster)"""
     stage_name: str = Field(..., min_length=1, max_length=100, description="Nombre de la etapa (Early Bird, Preventa, etc)")
@@ -66,14 +73,13 @@ class SaleStage(SaleStageBase):
 
     # Areas vinculadas con cantidades
     area_ids: List[int] = []
-    areas: List[dict] = []  # [{id, area_name, quantity}]
+    areas: List[SaleStageAreaRef] = []
 
     # Info de bundle
     is_bundle: bool = False  # True si tiene cantidades > 1
     total_tickets: int = 0  # Total de boletas en el bundle
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class SaleStageSummary(BaseModel):
@@ -91,12 +97,11 @@ class SaleStageSummary(BaseModel):
     is_currently_active: bool
     priority_order: int
     area_count: int = 0
-    areas: List[dict] = []  # [{id, area_name, quantity}]
+    areas: List[SaleStageAreaRef] = []
     is_bundle: bool = False
     total_tickets: int = 0
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class ActiveSaleStage(BaseModel):
@@ -1,4 +1,4 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, ConfigDict
 from typing import Optional, List
 from datetime import datetime
 from enum import Enum
@@ -50,8 +50,7 @@ class Transfer(BaseModel):
     area_name: Optional[str] = None
     unit_display_name: Optional[str] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class TransferSummary(BaseModel):
@@ -64,8 +63,7 @@ class TransferSummary(BaseModel):
     event_name: Optional[str] = None
     unit_display_name: Optional[str] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class TransferLogEntry(BaseModel):
@@ -79,8 +77,7 @@ class TransferLogEntry(BaseModel):
     from_user_name: Optional[str] = None
     to_user_name: Optional[str] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class PendingTransfer(BaseModel):
@@ -97,8 +94,7 @@ class PendingTransfer(BaseModel):
     initiated_at: datetime
     expires_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class TransferResult(BaseModel):
@@ -1,4 +1,4 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, ConfigDict
 from typing import Optional, List
 from datetime import datetime
 from enum import Enum
@@ -47,8 +47,7 @@ class Unit(UnitBase):
     # Campos calculados/relacionados
     display_name: Optional[str] = None  # Ej: "A-12" o "Mesa 5"
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class UnitSummary(BaseModel):
@@ -60,8 +59,7 @@ class UnitSummary(BaseModel):
     nomenclature_letter_area: Optional[str] = None
     nomenclature_number_unit: Optional[int] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class UnitBulkCreate(BaseModel):
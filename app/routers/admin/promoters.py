@@ -7,7 +7,7 @@ from fastapi import APIRouter, HTTPException, Request, Depends
 from pydantic import BaseModel
 from typing import Optional, List
 from app.database import get_db_connection
-from app.core.promoter_dependencies import require_promoter_access
+from app.core.promoter_dependencies import require_promoter_access, promoter_access_cache
 from app.core.dependencies import get_environment
 import logging
 
@@ -77,6 +77,7 @@ async def assign_promoter_role(
                 updated_at = now()
             RETURNING *
         """, data.tenant_member_id, data.site)
+        promoter_access_cache.clear()
 
         logger.info(
             f"Promoter role assigned to {data.tenant_member_id} "
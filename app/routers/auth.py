@@ -3,6 +3,7 @@ from pydantic import BaseModel, EmailStr, Field
 from typing import Optional
 from app.database import get_db_connection
 from app.config import settings
+from app.core.security import session_cache
 import secrets
 import logging
 import uuid
@@ -350,6 +351,7 @@ async def sign_out(request: Request, response: Response):
                 "UPDATE sessions SET is_active = false, ended_at = NOW(), end_reason = 'logout' WHERE id = $1",
                 session_token
             )
+        session_cache.pop(session_token)
 
     response.delete_cookie(key="session-token", path="/")
 
@@ -541,6 +543,7 @@ async def switch_tenant(data: SwitchTenantRequest, request: Request, response: R
             "UPDATE sessions SET is_active = false, ended_at = NOW(), end_reason = 'tenant_switch' WHERE id = $1",
             session_token
         )
+        session_cache.pop(session_token)
         logger.info(f"Ended session for tenant switch: {session_token}")
 
         # Create new session with new tenant
@@ -4,10 +4,10 @@ from datetime import datetime
 from app.core.dependencies import get_authenticated_user, AuthenticatedUser, get_environment
 from app.models.event import (
     Event, EventCreate, EventUpdate, EventUpdateResponse, EventSummary,
-    EventImageCreate, EventImage, LegalInfoCreate, LegalInfo
+    ClusterImageCreate, ClusterImage, LegalInfoCreate, LegalInfo
 )
 from app.models.event_image import (
-    EventImageCreate as NewEventImageCreate,
+    EventImageCreate,
     EventImageUpdate,
     EventImageSummary
 )
@@ -112,10 +112,10 @@ async def delete_event(
         raise HTTPException(status_code=404, detail="Event not found")
 
 
-@router.post("/{event_id}/images", response_model=EventImage, status_code=201)
+@router.post("/{event_id}/images", response_model=ClusterImage, status_code=201)
 async def add_event_image(
     event_id: int,
-    data: EventImageCreate,
+    data: ClusterImageCreate,
     user: AuthenticatedUser = Depends(get_authenticated_user)
 ):
     """
@@ -173,7 +173,7 @@ async def list_event_images(
 @router.post("/{event_id}/event-images", response_model=dict, status_code=201)
 async def create_event_image(
     event_id: int,
-    data: NewEventImageCreate,
+    data: EventImageCreate,
     user: AuthenticatedUser = Depends(get_authenticated_user)
 ):
     """
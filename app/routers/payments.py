@@ -5,6 +5,7 @@ Integración con Wompi (wompi.co) para pagos en Colombia.
 """
 from fastapi import APIRouter, Depends, HTTPException, Request
 from typing import List, Optional
+import orjson
 from app.core.dependencies import get_authenticated_user, AuthenticatedUser
 from app.models.payment import (
     Payment, PaymentCreate, PaymentSummary,
@@ -110,7 +111,7 @@ async def wompi_webhook(request: Request):
 
     Wompi sends transaction.updated events with signature for verification.
     """
-    event_data = await request.json()
+    event_data = orjson.loads(await request.body())
     await payments_service.process_gateway_webhook('wompi', event_data)
     return {"status": "received"}
 
@@ -161,7 +162,7 @@ async def simulate_payment(payment_id: int):
 
     **Note:** No authentication required for easier testing.
     """
-    if settings.wompi_environment != 'sandbox':
+    if settings.wompi.environment != 'sandbox':
         raise HTTPException(
             status_code=403,
             detail="Simulation only available in sandbox"
@@ -97,7 +97,7 @@ async def get_public_event_areas(
     No authentication required.
     Automatically filters by environment (dev/prod).
     """
-    event = await events_service.get_event_by_slug(slug, tenant_id=tenant_id, environment=environment)
+    event = await events_service.get_event_by_slug(slug, tenant_id=tenant_id, environment=environment, include_details=False)
     if not event:
         raise HTTPException(status_code=404, detail="Event not found")
 
@@ -116,7 +116,7 @@ async def get_public_event_summary(
     Includes total capacity, availability, and price range.
     Automatically filters by environment (dev/prod).
     """
-    event = await events_service.get_event_by_slug(slug, tenant_id=tenant_id, environment=environment)
+    event = await events_service.get_event_by_slug(slug, tenant_id=tenant_id, environment=environment, include_details=False)
     if not event:
         raise HTTPException(status_code=404, detail="Event not found")
 
@@ -154,7 +154,7 @@ async def get_public_event_promotions(
     No authentication required.
     Automatically filters by environment (dev/prod).
     """
-    event = await events_service.get_event_by_slug(slug, tenant_id=tenant_id, environment=environment)
+    event = await events_service.get_event_by_slug(slug, tenant_id=tenant_id, environment=environment, include_details=False)
     if not event:
         raise HTTPException(status_code=404, detail="Event not found")
 
@@ -174,7 +174,7 @@ async def get_public_event_sale_stages(
     No authentication required.
     Automatically filters by environment (dev/prod).
     """
-    event = await events_service.get_event_by_slug(slug, tenant_id=tenant_id, environment=environment)
+    event = await events_service.get_event_by_slug(slug, tenant_id=tenant_id, environment=environment, include_details=False)
     if not event:
         raise HTTPException(status_code=404, detail="Event not found")
 
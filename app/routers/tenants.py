@@ -2,6 +2,8 @@ from fastapi import APIRouter, Request, HTTPException
 from pydantic import BaseModel
 from typing import List, Optional
 from app.database import get_db_connection
+from app.core.promoter_dependencies import promoter_access_cache
+from app.core.security import session_cache
 from datetime import datetime
 import logging
 
@@ -33,7 +35,7 @@ async def get_user_tenants(request: Request):
     if not session_token:
         raise HTTPException(status_code=401, detail="Not authenticated")
 
-    async with get_db_connection() as conn:
+    async with get_db_connection(use_transaction=False) as conn:
         # Validate session and get user_id
         session = await conn.fetchrow("""
             SELECT user_id FROM sessions
@@ -166,6 +168,8 @@ async def delete_tenant_member(member_id: str, request: Request):
         await conn.execute("""
             DELETE FROM tenant_members WHERE id = $1 AND tenant_id = $2
         """, member_id, tenant_id)
+        promoter_access_cache.clear()
+        session_cache.clear()
 
         logger.info(f"Member {member_id} removed from tenant {tenant_id} by user {user_id}")
 
@@ -1,6 +1,7 @@
 import logging
 import json
 from typing import Optional, List
+from pydantic import TypeAdapter
 from decimal import Decimal
 from app.database import get_db_connection
 from app.models.area import (
@@ -11,6 +12,8 @@ from app.core.exceptions import ValidationError, DatabaseError
 
 logger = logging.getLogger(__name__)
 
+AREA_SUMMARY_LIST = TypeAdapter(List[AreaSummary])
+
 
 # Service fee configuration (from COTIZACION_WARO_TICKETS_2026.pdf)
 # Formula: price * 3.26% + $1,894 fixed (flat — no capacity tiers)
@@ -115,9 +118,9 @@ async def get_areas_by_event(
             # Calculate current price with sale stage
             current_price = await _calculate_current_price(conn, row['id'], row['price'])
             area_dict['current_price'] = current_price
-            areas.append(AreaSummary(**area_dict))
+            areas.append(area_dict)
 
-        return areas
+        return AREA_SUMMARY_LIST.validate_python(areas)
 
 
 async def get_area_by_id(
@@ -248,7 +251,8 @@ async def update_area(
         if not existing:
             return None
 
-        update_data = data.model_dump(exclude_unset=True)
+        # Fields sent by the client, in declaration order (keeps the SQL text stable)
+        update_data = {f: getattr(data, f) for f in type(data).model_fields if f in data.model_fields_set}
 
         # Validate capacity reduction doesn't strand sold/reserved units
         if 'capacity' in update_data:
@@ -486,9 +490,9 @@ async def get_public_areas(cluster_id: int) -> List[AreaSummary]:
             area_dict = dict(row)
             current_price = await _calculate_current_price(conn, row['id'], row['price'])
             area_dict['current_price'] = current_price
-            areas.append(AreaSummary(**area_dict))
+            areas.append(area_dict)
 
-        return areas
+        return AREA_SUMMARY_LIST.validate_python(areas)
 
 
 async def _calculate_current_price(conn, area_id: int, base_price: Decimal) -> Decimal:
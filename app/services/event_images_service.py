@@ -259,7 +259,7 @@ async def get_event_images_urls(cluster_id: int) -> dict:
     Useful for including in event responses.
     """
     try:
-        async with get_db_connection() as conn:
+        async with get_db_connection(use_transaction=False) as conn:
             rows = await conn.fetch("""
                 SELECT image_type, image_url
                 FROM event_images
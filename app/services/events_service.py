@@ -2,10 +2,11 @@ import logging
 import json
 from typing import Optional, List
 from datetime import datetime
+from pydantic import TypeAdapter
 from app.database import get_db_connection
 from app.models.event import (
     Event, EventCreate, EventUpdate, EventSummary,
-    EventImage, EventImageCreate, LegalInfo, LegalInfoCreate,
+    ClusterImage, ClusterImageCreate, LegalInfo, LegalInfoCreate,
     EventCreateWithAreas, EventUpdateWithAreas
 )
 from app.core.exceptions import ValidationError
@@ -13,6 +14,9 @@ import re
 
 logger = logging.getLogger(__name__)
 
+# Validates a whole listing in one call instead of one EventSummary(**row) per row
+EVENT_SUMMARY_LIST = TypeAdapter(List[EventSummary])
+
 
 def generate_slug(name: str) -> str:
     """Generate URL-friendly slug from event name"""
@@ -94,13 +98,30 @@ async def get_events(
 
         rows = await conn.fetch(query, *params)
         logger.info(f"get_events returned {len(rows)} events for tenant_id={tenant_id}")
-        return [EventSummary(**dict(row)) for row in rows]
+        return EVENT_SUMMARY_LIST.validate_python([dict(row) for row in rows])
+
+
+# cluster_images rows for Event.images, aggregated in the event query itself
+# (decoded to a list of dicts by the jsonb codec)
+EVENT_IMAGES_COLUMN = """(
+                    SELECT COALESCE(jsonb_agg(jsonb_build_object(
+                        'id', ci.id,
+                        'cluster_id', ci.cluster_id,
+                        'image_id', ci.image_id::text,
+                        'type_image', ci.type_image,
+                        'created_at', ci.created_at,
+                        'image_url', i.path
+                    )), '[]'::jsonb)
+                    FROM cluster_images ci
+                    LEFT JOIN images i ON ci.image_id = i.id
+                    WHERE ci.cluster_id = c.id
+                ) as images"""
 
 
 async def get_event_by_id(event_id: int, tenant_id: str) -> Optional[Event]:
     """Get event by ID with tenant validation"""
     async with get_db_connection(use_transaction=False) as conn:
-        row = await conn.fetchrow("""
+        row = await conn.fetchrow(f"""
             SELECT
                 c.*,
                 (SELECT COALESCE(SUM(a.capacity), 0) FROM areas a WHERE a.cluster_id = c.id) as total_capacity,
@@ -113,7 +134,8 @@ async def get_event_by_id(event_id: int, tenant_id: str) -> Optional[Event]:
                     SELECT COUNT(*) FROM units u
                     JOIN areas a ON u.area_id = a.id
                     WHERE a.cluster_id = c.id AND u.status = 'available'
-                ) as tickets_available
+                ) as tickets_available,
+                {EVENT_IMAGES_COLUMN}
             FROM clusters c
             WHERE c.id = $1 AND c.tenant_id = $2
         """, event_id, tenant_id)
@@ -134,37 +156,34 @@ async def get_event_by_id(event_id: int, tenant_id: str) -> Optional[Event]:
             except (json.JSONDecodeError, TypeError):
                 event_dict['extra_attributes'] = {}
 
-        # Get images
-        images = await conn.fetch("""
-            SELECT ci.*, i.path as image_url
-            FROM cluster_images ci
-            LEFT JOIN images i ON ci.image_id = i.id
-            WHERE ci.cluster_id = $1
-        """, event_id)
-
-        # Convert image UUIDs to strings
-        event_dict['images'] = []
-        for img in images:
-            img_dict = dict(img)
-            if img_dict.get('image_id'):
-                img_dict['image_id'] = str(img_dict['image_id'])
-            event_dict['images'].append(img_dict)
-
         return Event(**event_dict)
 
 
-async def get_event_by_slug(slug: str, tenant_id: Optional[str] = None, environment: str = "prod") -> Optional[Event]:
-    """Get event by slug (public access)"""
-    async with get_db_connection(use_transaction=False) as conn:
-        query = """
-            SELECT
-                c.*,
+EVENT_BY_SLUG_STATS = """,
                 (SELECT COALESCE(SUM(a.capacity), 0) FROM areas a WHERE a.cluster_id = c.id) as total_capacity,
                 (
                     SELECT COUNT(*) FROM units u
                     JOIN areas a ON u.area_id = a.id
                     WHERE a.cluster_id = c.id AND u.status = 'available'
-                ) as tickets_available
+                ) as tickets_available,
+                """ + EVENT_IMAGES_COLUMN
+
+
+async def get_event_by_slug(
+    slug: str,
+    tenant_id: Optional[str] = None,
+    environment: str = "prod",
+    include_details: bool = True
+) -> Optional[Event]:
+    """
+    Get event by slug (public access).
+    With include_details=False only the clusters row is loaded (no capacity
+    stats, no images), for callers that just need the event id/name.
+    """
+    async with get_db_connection(use_transaction=False) as conn:
+        query = f"""
+            SELECT
+                c.*{EVENT_BY_SLUG_STATS if include_details else ''}
             FROM clusters c
             WHERE c.slug_cluster = $1
               AND c.shadowban = false
@@ -182,7 +201,6 @@ async def get_event_by_slug(slug: str, tenant_id: Optional[str] = None, environm
             return None
 
         event_dict = dict(row)
-        event_dict['tickets_sold'] = event_dict.get('total_capacity', 0) - event_dict.get('tickets_available', 0)
 
         # Convert UUID to string
         if event_dict.get('profile_id'):
@@ -195,21 +213,8 @@ async def get_event_by_slug(slug: str, tenant_id: Optional[str] = None, environm
             except (json.JSONDecodeError, TypeError):
                 event_dict['extra_attributes'] = {}
 
-        # Get images
-        images = await conn.fetch("""
-            SELECT ci.*, i.path as image_url
-            FROM cluster_images ci
-            LEFT JOIN images i ON ci.image_id = i.id
-            WHERE ci.cluster_id = $1
-        """, row['id'])
-
-        # Convert image UUIDs to strings
-        event_dict['images'] = []
-        for img in images:
-            img_dict = dict(img)
-            if img_dict.get('image_id'):
-                img_dict['image_id'] = str(img_dict['image_id'])
-            event_dict['images'].append(img_dict)
+        if include_details:
+            event_dict['tickets_sold'] = event_dict['total_capacity'] - event_dict['tickets_available']
 
         return Event(**event_dict)
 
@@ -295,7 +300,8 @@ async def update_event(event_id: int, tenant_id: str, data: EventUpdate) -> Opti
         params = []
         param_idx = 1
 
-        update_data = data.model_dump(exclude_unset=True)
+        # Fields sent by the client, in declaration order (keeps the SQL text stable)
+        update_data = {f: getattr(data, f) for f in type(data).model_fields if f in data.model_fields_set}
 
         for field, value in update_data.items():
             # Serialize extra_attributes dict to JSON string
@@ -338,7 +344,7 @@ async def delete_event(event_id: int, tenant_id: str) -> bool:
         return deleted
 
 
-async def add_event_image(event_id: int, tenant_id: str, data: EventImageCreate) -> Optional[EventImage]:
+async def add_event_image(event_id: int, tenant_id: str, data: ClusterImageCreate) -> Optional[ClusterImage]:
     """Add image to event"""
     async with get_db_connection() as conn:
         # Verify tenant ownership
@@ -355,7 +361,7 @@ async def add_event_image(event_id: int, tenant_id: str, data: EventImageCreate)
             RETURNING *
         """, event_id, data.image_id, data.type_image)
 
-        return EventImage(**dict(row))
+        return ClusterImage(**dict(row))
 
 
 async def remove_event_image(event_id: int, tenant_id: str, image_id: int) -> bool:
@@ -583,9 +589,9 @@ async def get_public_events(
             for key in ['featured_promo_id', 'featured_promo_name', 'featured_promo_pricing_type', 'featured_promo_pricing_value']:
                 row_dict.pop(key, None)
 
-            results.append(EventSummary(**row_dict))
+            results.append(row_dict)
 
-        return results
+        return EVENT_SUMMARY_LIST.validate_python(results)
 
 
 async def create_legal_info(data: LegalInfoCreate) -> LegalInfo:
@@ -742,7 +748,10 @@ async def update_event_with_areas(
             return None
 
         # Update event fields
-        update_data = data.model_dump(exclude_unset=True, exclude={'areas'})
+        update_data = {
+            f: getattr(data, f) for f in type(data).model_fields
+            if f in data.model_fields_set and f != 'areas'
+        }
         if update_data:
             update_fields = []
             params = []
@@ -814,7 +823,10 @@ async def update_event_with_areas(
                         area_params = []
                         area_param_idx = 1
 
-                        area_update_data = area_data.model_dump(exclude_unset=True, exclude={'id', 'is_deleted'})
+                        area_update_data = {
+                            f: getattr(area_data, f) for f in type(area_data).model_fields
+                            if f in area_data.model_fields_set and f not in ('id', 'is_deleted')
+                        }
                         for field, value in area_update_data.items():
                             if field == 'extra_attributes' and isinstance(value, dict):
                                 value = json.dumps(value)
@@ -9,17 +9,12 @@ from dataclasses import dataclass
 from typing import Optional, Dict, Any
 from decimal import Decimal
 from datetime import datetime
-from enum import Enum
 
+# Unified payment status across all gateways (same enum the API models use)
+from app.models.payment import PaymentStatus
 
-class PaymentStatus(str, Enum):
-    """Unified payment status across all gateways"""
-    PENDING = "pending"
-    APPROVED = "approved"
-    DECLINED = "declined"
-    VOIDED = "voided"
-    ERROR = "error"
-    REFUNDED = "refunded"
+# Lowercase status value -> PaymentStatus, built once for map_status()
+PAYMENT_STATUS_BY_VALUE = {status.value: status for status in PaymentStatus}
 
 
 @dataclass
@@ -146,12 +141,4 @@ class BaseGateway(ABC):
         Map gateway-specific status to unified PaymentStatus.
         Override in subclasses for gateway-specific mappings.
         """
-        status_map = {
-            'approved': PaymentStatus.APPROVED,
-            'pending': PaymentStatus.PENDING,
-            'declined': PaymentStatus.DECLINED,
-            'voided': PaymentStatus.VOIDED,
-            'error': PaymentStatus.ERROR,
-            'refunded': PaymentStatus.REFUNDED,
-        }
-        return status_map.get(gateway_status.lower(), PaymentStatus.PENDING)
+        return PAYMENT_STATUS_BY_VALUE.get(gateway_status.lower(), PaymentStatus.PENDING)
@@ -28,16 +28,25 @@ logger = logging.getLogger(__name__)
 WOMPI_SANDBOX_URL = "https://sandbox.wompi.co/v1"
 WOMPI_PRODUCTION_URL = "https://production.wompi.co/v1"
 
+# Wompi transaction status -> unified PaymentStatus
+WOMPI_STATUS_MAP = {
+    "APPROVED": PaymentStatus.APPROVED,
+    "PENDING": PaymentStatus.PENDING,
+    "DECLINED": PaymentStatus.DECLINED,
+    "VOIDED": PaymentStatus.VOIDED,
+    "ERROR": PaymentStatus.ERROR,
+}
+
 
 class WompiGateway(BaseGateway):
     """Wompi payment gateway implementation using Payment Links API"""
 
     def __init__(self):
-        self.public_key = settings.wompi_public_key
-        self.private_key = settings.wompi_private_key
-        self.events_secret = settings.wompi_events_secret
-        self.integrity_secret = getattr(settings, 'wompi_integrity_secret', None)
-        self.environment = settings.wompi_environment
+        self.public_key = settings.wompi.public_key
+        self.private_key = settings.wompi.private_key
+        self.events_secret = settings.wompi.events_secret
+        self.integrity_secret = settings.wompi.integrity_secret
+        self.environment = settings.wompi.environment
 
         # Set base URL based on environment
         if self.environment == 'production':
@@ -396,11 +405,4 @@ class WompiGateway(BaseGateway):
 
     def _map_wompi_status(self, wompi_status: str) -> PaymentStatus:
         """Map Wompi status to unified PaymentStatus"""
-        status_map = {
-            "APPROVED": PaymentStatus.APPROVED,
-            "PENDING": PaymentStatus.PENDING,
-            "DECLINED": PaymentStatus.DECLINED,
-            "VOIDED": PaymentStatus.VOIDED,
-            "ERROR": PaymentStatus.ERROR,
-        }
-        return status_map.get(wompi_status.upper(), PaymentStatus.PENDING)
+        return WOMPI_STATUS_MAP.get(wompi_status.upper(), PaymentStatus.PENDING)
@@ -199,7 +199,7 @@ async def resend_invitation(invitation_id: str, tenant_id: str) -> dict:
     Raises:
         ValueError: If invitation not found or already accepted
     """
-    async with get_db_connection() as conn:
+    async with get_db_connection(use_transaction=False) as conn:
         invitation = await conn.fetchrow("""
             SELECT ti.*, t.name as tenant_name, p.name as invited_by_name
             FROM tenant_invitations ti
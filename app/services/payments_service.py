@@ -8,6 +8,7 @@ Supports multiple payment gateways:
 """
 import logging
 import secrets
+import orjson
 from typing import Optional
 from datetime import datetime, timedelta
 from decimal import Decimal
@@ -22,6 +23,7 @@ from app.models.payment import (
 from app.services import reservations_service, email_service
 from app.services.gateways import get_gateway
 from app.services.gateways.base import PaymentData, PaymentStatus
+from app.services.gateways.wompi import WOMPI_STATUS_MAP
 from app.core.exceptions import PaymentError, ValidationError
 from app.services.discord_service import discord_purchase_service
 
@@ -30,6 +32,27 @@ logger = logging.getLogger(__name__)
 # Reservation timeout in minutes
 PAYMENT_TIMEOUT_MINUTES = 15
 
+PAYMENT_JSON_FIELDS = ('payment_method_data', 'customer_data', 'billing_data')
+
+# Statuses after which a payment is never reprocessed
+FINAL_PAYMENT_STATUSES = frozenset(
+    s.value for s in (PaymentStatus.APPROVED, PaymentStatus.DECLINED, PaymentStatus.VOIDED, PaymentStatus.ERROR)
+)
+
+
+def _payment_from_row(row) -> Payment:
+    """Build a Payment from a payments row"""
+    payment_dict = dict(row)
+    if payment_dict.get('reservation_id'):
+        payment_dict['reservation_id'] = str(payment_dict['reservation_id'])
+
+    # JSONB columns may come back as strings — parse them
+    for field in PAYMENT_JSON_FIELDS:
+        if isinstance(payment_dict.get(field), str):
+            payment_dict[field] = orjson.loads(payment_dict[field])
+
+    return Payment(**payment_dict)
+
 
 async def create_payment_intent(data: PaymentCreate) -> PaymentIntentResponse:
     """
@@ -153,7 +176,7 @@ async def create_payment_intent(data: PaymentCreate) -> PaymentIntentResponse:
             amount_in_cents,
             data.customer_email,
             reference,
-            settings.wompi_environment,  # Use same env setting
+            settings.wompi.environment,  # Use same env setting
             gateway.name,
             intent.gateway_order_id,
             initial_customer_data
@@ -199,16 +222,7 @@ async def get_payment_by_id(payment_id: int, user_id: Optional[str] = None) -> O
         if not row:
             return None
 
-        import json
-        payment_dict = dict(row)
-        if payment_dict.get('reservation_id'):
-            payment_dict['reservation_id'] = str(payment_dict['reservation_id'])
-
-        for field in ('payment_method_data', 'customer_data', 'billing_data'):
-            if isinstance(payment_dict.get(field), str):
-                payment_dict[field] = json.loads(payment_dict[field])
-
-        return Payment(**payment_dict)
+        return _payment_from_row(row)
 
 
 async def get_payment_by_reference(reference: str) -> Optional[Payment]:
@@ -222,16 +236,7 @@ async def get_payment_by_reference(reference: str) -> Optional[Payment]:
         if not row:
             return None
 
-        import json
-        payment_dict = dict(row)
-        if payment_dict.get('reservation_id'):
-            payment_dict['reservation_id'] = str(payment_dict['reservation_id'])
-
-        for field in ('payment_method_data', 'customer_data', 'billing_data'):
-            if isinstance(payment_dict.get(field), str):
-                payment_dict[field] = json.loads(payment_dict[field])
-
-        return Payment(**payment_dict)
+        return _payment_from_row(row)
 
 
 async def get_payment_by_gateway_order(gateway_order_id: str) -> Optional[Payment]:
@@ -245,17 +250,7 @@ async def get_payment_by_gateway_order(gateway_order_id: str) -> Optional[Paymen
         if not row:
             return None
 
-        import json
-        payment_dict = dict(row)
-        if payment_dict.get('reservation_id'):
-            payment_dict['reservation_id'] = str(payment_dict['reservation_id'])
-
-        # JSONB columns may come back as strings — parse them
-        for field in ('payment_method_data', 'customer_data', 'billing_data'):
-            if isinstance(payment_dict.get(field), str):
-                payment_dict[field] = json.loads(payment_dict[field])
-
-        return Payment(**payment_dict)
+        return _payment_from_row(row)
 
 
 async def process_gateway_webhook(gateway_name: str, event_data: dict) -> bool:
@@ -290,7 +285,7 @@ async def process_gateway_webhook(gateway_name: str, event_data: dict) -> bool:
 
     # Update payment status
     new_status = result.status.value
-    is_final = new_status in ('approved', 'declined', 'voided', 'error')
+    is_final = new_status in FINAL_PAYMENT_STATUSES
 
     async with get_db_connection() as conn:
         await conn.execute("""
@@ -387,7 +382,7 @@ async def get_payments_by_reservation(reservation_id: str) -> list[PaymentSummar
 
 async def simulate_payment_approval(payment_id: int) -> PaymentConfirmation:
     """Simulate payment approval (for testing in sandbox)"""
-    if settings.wompi_environment != 'sandbox':
+    if settings.wompi.environment != 'sandbox':
         raise PaymentError("Simulation only available in sandbox environment")
 
     async with get_db_connection() as conn:
@@ -453,7 +448,7 @@ async def check_payment_status(payment_id: int) -> Payment:
         raise ValidationError("Payment not found")
 
     # If already finalized, return current status
-    if payment.status in ['approved', 'declined', 'voided', 'error']:
+    if payment.status in FINAL_PAYMENT_STATUSES:
         return payment
 
     # Query gateway for current status
@@ -549,7 +544,7 @@ async def verify_transaction(transaction_id: str) -> Payment:
     try:
         async with httpx.AsyncClient() as client:
             # Determine environment
-            if settings.wompi_environment == 'production':
+            if settings.wompi.environment == 'production':
                 base_url = "https://production.wompi.co/v1"
             else:
                 base_url = "https://sandbox.wompi.co/v1"
@@ -557,7 +552,7 @@ async def verify_transaction(transaction_id: str) -> Payment:
             response = await client.get(
                 f"{base_url}/transactions/{transaction_id}",
                 headers={
-                    "Authorization": f"Bearer {settings.wompi_private_key}",
+                    "Authorization": f"Bearer {settings.wompi.private_key}",
                     "Content-Type": "application/json"
                 },
                 timeout=30.0
@@ -586,7 +581,7 @@ async def verify_transaction(transaction_id: str) -> Payment:
         raise ValidationError(f"Payment not found for payment link: {payment_link_id}")
 
     # If already finalized, ensure reservation is confirmed and return
-    if payment.status in ['approved', 'declined', 'voided', 'error']:
+    if payment.status in FINAL_PAYMENT_STATUSES:
         # Even if payment was already finalized, ensure reservation is confirmed
         # (handles cases where reservation expired during payment)
         if payment.status == 'approved':
@@ -606,19 +601,12 @@ async def verify_transaction(transaction_id: str) -> Payment:
 
     # Map Wompi status to our status
     wompi_status = tx_data.get("status", "").upper()
-    status_map = {
-        "APPROVED": "approved",
-        "PENDING": "pending",
-        "DECLINED": "declined",
-        "VOIDED": "voided",
-        "ERROR": "error",
-    }
-    new_status = status_map.get(wompi_status, "pending")
+    new_status = WOMPI_STATUS_MAP.get(wompi_status, PaymentStatus.PENDING).value
 
     # Update our payment record
     async with get_db_connection() as conn:
         payment_method_data = tx_data.get("payment_method")
-        is_final = new_status in ['approved', 'declined', 'voided', 'error']
+        is_final = new_status in FINAL_PAYMENT_STATUSES
 
         # Extract customer data from tx_data (Wompi transaction object)
         from app.services.gateways.wompi import WompiGateway
@@ -8,12 +8,19 @@ from app.utils.qr_generator import (
 )
 from app.models.qr import (
     QRCodeResponse, QRValidationRequest, QRValidationResponse,
-    ValidationResult, TicketCheckIn, CheckInStats
+    ValidationResult, TicketCheckIn, CheckInStats, VALIDATION_MESSAGES
 )
 from app.core.exceptions import ValidationError
 
 logger = logging.getLogger(__name__)
 
+# reservation_units.status values that reject entry outright
+REJECTED_TICKET_STATUSES = {
+    'used': ValidationResult.ALREADY_USED,
+    'transferred': ValidationResult.TICKET_TRANSFERRED,
+    'cancelled': ValidationResult.TICKET_CANCELLED,
+}
+
 
 async def _track_reservation_unit_status(
     conn,
@@ -99,7 +106,7 @@ async def validate_qr(
         return QRValidationResponse(
             is_valid=False,
             result=ValidationResult.INVALID_SIGNATURE,
-            message="Codigo QR invalido o alterado"
+            message=VALIDATION_MESSAGES[ValidationResult.INVALID_SIGNATURE]
         )
 
     async with get_db_connection() as conn:
@@ -124,7 +131,7 @@ async def validate_qr(
             return QRValidationResponse(
                 is_valid=False,
                 result=ValidationResult.TICKET_NOT_FOUND,
-                message="Boleto no encontrado"
+                message=VALIDATION_MESSAGES[ValidationResult.TICKET_NOT_FOUND]
             )
 
         # Verify event matches
@@ -136,25 +143,12 @@ async def validate_qr(
             )
 
         # Check ticket status
-        if ticket['status'] == 'used':
-            return QRValidationResponse(
-                is_valid=False,
-                result=ValidationResult.ALREADY_USED,
-                message="Este boleto ya fue utilizado"
-            )
-
-        if ticket['status'] == 'transferred':
-            return QRValidationResponse(
-                is_valid=False,
-                result=ValidationResult.TICKET_TRANSFERRED,
-                message="Este boleto fue transferido a otro usuario"
-            )
-
-        if ticket['status'] == 'cancelled':
+        rejected = REJECTED_TICKET_STATUSES.get(ticket['status'])
+        if rejected:
             return QRValidationResponse(
                 is_valid=False,
-                result=ValidationResult.TICKET_CANCELLED,
-                message="Este boleto fue cancelado"
+                result=rejected,
+                message=VALIDATION_MESSAGES[rejected]
             )
 
         if ticket['status'] != 'confirmed':
@@ -193,7 +187,7 @@ async def validate_qr(
         return QRValidationResponse(
             is_valid=True,
             result=ValidationResult.VALID,
-            message="Boleto valido - Acceso permitido",
+            message=VALIDATION_MESSAGES[ValidationResult.VALID],
             reservation_unit_id=ticket['id'],
             reservation_id=str(ticket['reservation_id']),
             unit_id=ticket['unit_id'],
@@ -265,7 +259,7 @@ async def validate_qr_simple(
             return QRValidationResponse(
                 is_valid=False,
                 result=ValidationResult.TICKET_NOT_FOUND,
-                message="Boleto no encontrado"
+                message=VALIDATION_MESSAGES[ValidationResult.TICKET_NOT_FOUND]
             )
 
         # Verify event matches
@@ -277,25 +271,12 @@ async def validate_qr_simple(
             )
 
         # Check ticket status
-        if ticket['status'] == 'used':
-            return QRValidationResponse(
-                is_valid=False,
-                result=ValidationResult.ALREADY_USED,
-                message="Este boleto ya fue utilizado"
-            )
-
-        if ticket['status'] == 'transferred':
-            return QRValidationResponse(
-                is_valid=False,
-                result=ValidationResult.TICKET_TRANSFERRED,
-                message="Este boleto fue transferido a otro usuario"
-            )
-
-        if ticket['status'] == 'cancelled':
+        rejected = REJECTED_TICKET_STATUSES.get(ticket['status'])
+        if rejected:
             return QRValidationResponse(
                 is_valid=False,
-                result=ValidationResult.TICKET_CANCELLED,
-                message="Este boleto fue cancelado"
+                result=rejected,
+                message=VALIDATION_MESSAGES[rejected]
             )
 
         if ticket['status'] != 'confirmed':
@@ -331,7 +312,7 @@ async def validate_qr_simple(
         return QRValidationResponse(
             is_valid=True,
             result=ValidationResult.VALID,
-            message="Boleto valido - Acceso permitido",
+            message=VALIDATION_MESSAGES[ValidationResult.VALID],
             reservation_unit_id=ticket['id'],
             reservation_id=str(ticket['reservation_id']),
             unit_id=ticket['unit_id'],
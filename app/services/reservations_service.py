@@ -4,6 +4,7 @@ import uuid
 from typing import Optional, List
 from datetime import datetime, timedelta
 from decimal import Decimal
+from pydantic import TypeAdapter
 from app.database import get_db_connection
 from app.models.reservation import (
     Reservation, ReservationCreate, ReservationUpdate,
@@ -20,6 +21,14 @@ logger = logging.getLogger(__name__)
 # Reservation expires after 15 minutes without payment
 RESERVATION_TIMEOUT_MINUTES = 15
 
+RESERVATION_SUMMARY_LIST = TypeAdapter(List[ReservationSummary])
+MY_TICKET_LIST = TypeAdapter(List[MyTicket])
+
+
+def _stringify_uuids(row) -> dict:
+    """Row as a dict with UUID values as strings (the reservation models type ids as str)"""
+    return {k: str(v) if isinstance(v, uuid.UUID) else v for k, v in row.items()}
+
 
 async def get_reservations(
     user_id: str,
@@ -55,7 +64,7 @@ async def get_reservations(
         params.extend([limit, offset])
 
         rows = await conn.fetch(query, *params)
-        return [ReservationSummary(**dict(row)) for row in rows]
+        return RESERVATION_SUMMARY_LIST.validate_python([_stringify_uuids(row) for row in rows])
 
 
 async def get_event_reservations(
@@ -355,11 +364,7 @@ async def get_reservation_by_id(reservation_id: str, user_id: str) -> Optional[R
         if not row:
             return None
 
-        reservation_dict = dict(row)
-        # Convert UUIDs to strings
-        for uuid_field in ['id', 'user_id']:
-            if reservation_dict.get(uuid_field) is not None:
-                reservation_dict[uuid_field] = str(reservation_dict[uuid_field])
+        reservation_dict = _stringify_uuids(row)
         # Parse extra_attributes JSON string to dict
         if reservation_dict.get('extra_attributes') and isinstance(reservation_dict['extra_attributes'], str):
             reservation_dict['extra_attributes'] = json.loads(reservation_dict['extra_attributes'])
@@ -394,11 +399,7 @@ async def get_reservation_by_id(reservation_id: str, user_id: str) -> Optional[R
         subtotal = Decimal("0")
 
         for unit in units:
-            unit_dict = dict(unit)
-            # Convert UUIDs to strings
-            for uuid_field in ['reservation_id', 'original_user_id', 'applied_promotion_id', 'applied_area_sale_stage_id']:
-                if unit_dict.get(uuid_field) is not None:
-                    unit_dict[uuid_field] = str(unit_dict[uuid_field])
+            unit_dict = _stringify_uuids(unit)
             unit_dict['unit_display_name'] = f"{unit['nomenclature_letter_area'] or ''}-{unit['nomenclature_number_unit'] or unit['id']}".strip('-')
             unit_dict['final_price'] = unit['base_price']  # TODO: Apply discounts
             subtotal += Decimal(str(unit['base_price']))
@@ -943,14 +944,14 @@ async def get_my_tickets(user_id: str) -> List[MyTicket]:
 
         for row in rows:
             owned_unit_ids.add(row['reservation_unit_id'])
-            ticket_dict = dict(row)
+            ticket_dict = _stringify_uuids(row)
             ticket_dict['unit_display_name'] = f"{row['nomenclature_letter_area'] or ''}-{row['nomenclature_number_unit'] or row['unit_id']}".strip('-')
             ticket_dict['can_transfer'] = row['status'] == 'confirmed'
             ticket_dict['qr_code_url'] = None  # Will be generated on demand
             # Parse qr_data if it's a string
             if ticket_dict.get('qr_data') and isinstance(ticket_dict['qr_data'], str):
                 ticket_dict['qr_data'] = json.loads(ticket_dict['qr_data'])
-            tickets.append(MyTicket(**ticket_dict))
+            tickets.append(ticket_dict)
 
         # Query 2: Tickets the user transferred out (given to others)
         transferred_out_rows = await conn.fetch(f"""
@@ -987,16 +988,16 @@ async def get_my_tickets(user_id: str) -> List[MyTicket]:
             if row['reservation_unit_id'] in owned_unit_ids:
                 continue
 
-            ticket_dict = dict(row)
+            ticket_dict = _stringify_uuids(row)
             ticket_dict['unit_display_name'] = f"{row['nomenclature_letter_area'] or ''}-{row['nomenclature_number_unit'] or row['unit_id']}".strip('-')
             ticket_dict['can_transfer'] = False  # Can't transfer a ticket you gave away
             ticket_dict['qr_code_url'] = None
-            tickets.append(MyTicket(**ticket_dict))
+            tickets.append(ticket_dict)
 
         # Sort all tickets by event date
-        tickets.sort(key=lambda t: t.event_date)
+        tickets.sort(key=lambda t: t['event_date'])
 
-        return tickets
+        return MY_TICKET_LIST.validate_python(tickets)
 
 
 async def get_reservation_timeout(reservation_id: str, user_id: str) -> Optional[ReservationTimeout]:
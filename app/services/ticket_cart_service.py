@@ -794,7 +794,7 @@ async def checkout(
     full_cart = await get_cart(cart_id)
     cart_total = full_cart.total  # This is the correct total with all discounts
 
-    async with get_db_connection() as conn:
+    async with get_db_connection(use_transaction=False) as conn:
         # Get cart
         cart = await conn.fetchrow("""
             SELECT * FROM ticket_carts WHERE id = $1 AND status = 'active'
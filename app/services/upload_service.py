@@ -14,9 +14,9 @@ def get_r2_client():
     """Get Cloudflare R2 client (S3-compatible)"""
     return boto3.client(
         's3',
-        endpoint_url=settings.r2_endpoint,
-        aws_access_key_id=settings.r2_access_key_id,
-        aws_secret_access_key=settings.r2_secret_access_key,
+        endpoint_url=settings.r2.endpoint,
+        aws_access_key_id=settings.r2.access_key_id,
+        aws_secret_access_key=settings.r2.secret_access_key,
         region_name='auto'
     )
 
@@ -41,7 +41,7 @@ async def upload_image(
 
         # Upload to R2
         client.put_object(
-            Bucket=settings.r2_bucket,
+            Bucket=settings.r2.bucket,
             Key=unique_name,
             Body=file_content,
             ContentType=content_type
@@ -50,7 +50,7 @@ async def upload_image(
         # Generate public URL
         # R2 URLs are typically: https://{account}.r2.cloudflarestorage.com/{bucket}/{key}
         # Or with custom domain: https://assets.warotickets.com/{key}
-        public_url = f"{settings.r2_endpoint}/{settings.r2_bucket}/{unique_name}"
+        public_url = f"{settings.r2.endpoint}/{settings.r2.bucket}/{unique_name}"
 
         # Store in database
         async with get_db_connection() as conn:
@@ -96,14 +96,14 @@ async def upload_to_r2(
 
         # Upload to R2
         client.put_object(
-            Bucket=settings.r2_bucket,
+            Bucket=settings.r2.bucket,
             Key=unique_key,
             Body=file_content,
             ContentType=content_type
         )
 
         # Generate public URL (using r2.dev public URL)
-        public_url = f"{settings.r2_public_url}/{unique_key}"
+        public_url = f"{settings.r2.public_url}/{unique_key}"
 
         logger.info(f"Uploaded to R2: {unique_key}")
 
@@ -138,13 +138,13 @@ async def delete_image(image_id: int) -> bool:
             # Extract key from URL
             url = image['url']
             # Parse key from URL (after bucket name)
-            key = url.split(f"{settings.r2_bucket}/")[-1] if settings.r2_bucket in url else None
+            key = url.split(f"{settings.r2.bucket}/")[-1] if settings.r2.bucket in url else None
 
             # Delete from R2
             if key:
                 try:
                     client = get_r2_client()
-                    client.delete_object(Bucket=settings.r2_bucket, Key=key)
+                    client.delete_object(Bucket=settings.r2.bucket, Key=key)
                 except Exception as e:
                     logger.warning(f"Failed to delete from R2: {e}")
 
@@ -181,7 +181,7 @@ async def get_presigned_upload_url(
         presigned_url = client.generate_presigned_url(
             'put_object',
             Params={
-                'Bucket': settings.r2_bucket,
+                'Bucket': settings.r2.bucket,
                 'Key': unique_key,
                 'ContentType': content_type
             },
@@ -189,7 +189,7 @@ async def get_presigned_upload_url(
         )
 
         # Final URL where the file will be accessible (public r2.dev URL)
-        final_url = f"{settings.r2_public_url}/{unique_key}"
+        final_url = f"{settings.r2.public_url}/{unique_key}"
 
         return {
             "upload_url": presigned_url,
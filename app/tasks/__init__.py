@@ -5,3 +5,4 @@ from app.tasks.cleanup import (
     cleanup_expired_sessions,
     run_cleanup_loop
 )
+from app.tasks.session_activity import run_session_activity_loop
@@ -0,0 +1,30 @@
+import asyncio
+import logging
+from app.core.security import flush_session_activity
+
+logger = logging.getLogger(__name__)
+
+# How often touched sessions are written back to the database
+FLUSH_INTERVAL_SECONDS = 1
+
+
+async def run_session_activity_loop():
+    """
+    Persist session last_activity_at in batches.
+    Request handlers only record the token; this loop issues one UPDATE per interval.
+    """
+    logger.info("Starting session activity flush task...")
+
+    try:
+        while True:
+            await asyncio.sleep(FLUSH_INTERVAL_SECONDS)
+            try:
+                await flush_session_activity()
+            except Exception as e:
+                logger.error(f"Error flushing session activity: {e}")
+    finally:
+        # Write whatever is still pending on shutdown
+        try:
+            await flush_session_activity()
+        except Exception as e:
+            logger.error(f"Error flushing session activity on shutdown: {e}")
@@ -0,0 +1,26 @@
+-- ============================================================================
+-- Migration 017: Partial index for active tenant_sites lookups
+-- Purpose: Every authenticated request resolves the session tenant's active
+--          site (LATERAL subquery on tenant_id + is_active), and the
+--          session-cookie domain lookup joins tenant_sites the same way.
+--          Both only ever touch active rows, so a partial index keeps it small.
+--
+-- IMPORTANT: CREATE INDEX CONCURRENTLY cannot run inside a transaction block.
+-- Run this file with psql directly:
+--   psql $DATABASE_URL -f migrations/017_tenant_sites_active_indexes.sql
+-- Do NOT wrap in BEGIN/COMMIT.
+-- ============================================================================
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS
+    idx_tenant_sites_active_tenant
+    ON tenant_sites(tenant_id)
+    WHERE is_active = true;
+
+-- ============================================================================
+-- Verification query (run after migration):
+--
+-- SELECT indexname, indexdef
+-- FROM pg_indexes
+-- WHERE tablename = 'tenant_sites'
+--   AND indexname = 'idx_tenant_sites_active_tenant';
+-- ============================================================================
@@ -66,10 +66,20 @@ def mock_db(mock_db_connection):
         async def __aexit__(self, *args):
             pass
 
-    # Patch both the original module and where it's imported in middleware
     with patch('app.database.get_db_connection', return_value=MockContextManager()):
-        with patch('app.core.middleware.get_db_connection', return_value=MockContextManager()):
-            yield mock_db_connection
+        yield mock_db_connection
+
+
+@pytest.fixture(autouse=True)
+def clear_caches():
+    """Evita que sesiones/roles cacheados se filtren entre tests."""
+    from app.core.security import session_cache, jwt_cache
+    from app.core.promoter_dependencies import promoter_access_cache
+
+    session_cache.clear()
+    jwt_cache.clear()
+    promoter_access_cache.clear()
+    yield
 
 
 # ============================================================================
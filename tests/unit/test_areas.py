@@ -267,6 +267,31 @@ class TestUpdateAreaServiceFees:
         assert not mock_conn.was_called_with("execute", "UPDATE clusters SET total_capacity")
 
 
+class TestAreaSummaryListing:
+    """Tests para los listados de AreaSummary (get_areas_by_event / get_public_areas)."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("list_areas", [
+        lambda: areas_service.get_areas_by_event(1, "profile-1", "tenant-1"),
+        lambda: areas_service.get_public_areas(1),
+    ])
+    async def test_service_serializes_as_number(self, list_areas):
+        """asyncpg entrega service como Decimal; la respuesta debe ser un número JSON."""
+        mock_conn = MockDBConnection()
+        mock_conn.set_fetchrow_return("SELECT id FROM clusters", {"id": 1})
+        mock_conn.set_fetch_return("FROM areas a", [{
+            "id": 1, "area_name": "VIP", "description": None, "capacity": 100,
+            "price": Decimal("100000"), "currency": "COP", "status": "available",
+            "nomenclature_letter": "V", "units_available": 100,
+            "service": Decimal("5.50"), "active_sale_stage": None,
+        }])
+
+        with patch('app.services.areas_service.get_db_connection', return_value=MockDBContextManager(mock_conn)):
+            areas = await list_areas()
+
+        assert areas[0].model_dump(mode="json")["service"] == 5.5
+
+
 class TestCalculateServiceFee:
     """Tests unitarios para calculate_service_fee() — fórmula plana price * 3.26% + $1,894."""
 
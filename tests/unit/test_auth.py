@@ -272,3 +272,20 @@ class TestSignOut:
         assert response.status_code == 200
         data = response.json()
         assert data["success"] is True
+
+
+class TestSessionCookieParsing:
+    """Tests for the Cookie header fast path used by get_session_token"""
+
+    def test_extracts_all_session_tokens(self):
+        """Picks every session-token value and ignores other cookies."""
+        from app.core.security import _parse_session_tokens
+
+        header = "_ga=GA1.2.3; session-token=first; theme=dark;session-token=second"
+        assert _parse_session_tokens(header) == ["first", "second"]
+
+    def test_ignores_empty_and_similar_names(self):
+        """Empty values and cookies that merely contain the name are skipped."""
+        from app.core.security import _parse_session_tokens
+
+        assert _parse_session_tokens("session-token=; old-session-token=x") == []
@@ -0,0 +1,138 @@
+"""
+Tests para el cache TTL en memoria (app.core.cache).
+"""
+import asyncio
+import pytest
+from unittest.mock import patch
+
+from app.core.cache import TTLCache
+
+
+class TestTTLCache:
+    """Tests para TTLCache"""
+
+    def test_entries_expire_after_ttl(self):
+        """Una entrada vencida se descarta en la lectura."""
+        cache = TTLCache(ttl=30)
+        with patch('app.core.cache.time.monotonic', return_value=100.0):
+            cache.set("k", "v")
+        with patch('app.core.cache.time.monotonic', return_value=129.0):
+            assert cache.get("k") == "v"
+        with patch('app.core.cache.time.monotonic', return_value=130.0):
+            assert cache.get("k") is None
+        assert len(cache) == 0
+
+    def test_evicts_oldest_when_full(self):
+        """Al superar maxsize se elimina la entrada más antigua."""
+        cache = TTLCache(ttl=30, maxsize=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.set("c", 3)
+        assert cache.get("a") is None
+        assert cache.get("b") == 2
+        assert cache.get("c") == 3
+
+    @pytest.mark.asyncio
+    async def test_get_or_load_coalesces_concurrent_misses(self):
+        """Misses concurrentes sobre la misma llave ejecutan un solo loader."""
+        cache = TTLCache(ttl=30)
+        calls = 0
+
+        async def loader():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0)
+            return {"tenant_id": "t1"}
+
+        results = await asyncio.gather(*(cache.get_or_load("token", loader) for _ in range(5)))
+
+        assert calls == 1
+        assert all(r == {"tenant_id": "t1"} for r in results)
+
+    @pytest.mark.asyncio
+    async def test_get_or_load_does_not_cache_none(self):
+        """Un resultado None no queda en cache."""
+        cache = TTLCache(ttl=30)
+
+        async def loader():
+            return None
+
+        assert await cache.get_or_load("token", loader) is None
+        assert len(cache) == 0
+
+
+class TestSessionCache:
+    """Tests para el cache de sesiones en get_session_from_request"""
+
+    @pytest.mark.asyncio
+    async def test_cached_session_skips_db(self, mock_db):
+        """Un token en cache se resuelve sin consultar la base de datos."""
+        from starlette.requests import Request
+        from app.core.security import get_session_from_request, session_cache
+
+        session_data = {"user_id": "user-1", "tenant_id": "tenant-1"}
+        session_cache.set("cached-token", session_data)
+        request = Request({
+            "type": "http",
+            "headers": [(b"cookie", b"session-token=cached-token")],
+        })
+
+        assert await get_session_from_request(request) is session_data
+        mock_db.fetchrow.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_activity_is_flushed_in_one_update(self, mock_db):
+        """Las sesiones tocadas se persisten en un solo UPDATE."""
+        from app.core import security
+
+        security._pending_activity.clear()
+        security.touch_session("token-a")
+        security.touch_session("token-b")
+        security.touch_session("token-a")
+
+        assert await security.flush_session_activity() == 2
+        mock_db.execute.assert_called_once()
+        assert sorted(mock_db.execute.call_args.args[1]) == ["token-a", "token-b"]
+        assert await security.flush_session_activity() == 0
+
+    @pytest.mark.asyncio
+    async def test_failed_flush_keeps_pending_activity(self, mock_db):
+        """Si el UPDATE falla, las sesiones quedan pendientes para el siguiente flush."""
+        from app.core import security
+
+        security._pending_activity.clear()
+        security.touch_session("token-a")
+        mock_db.execute.side_effect = ConnectionError("db down")
+
+        with pytest.raises(ConnectionError):
+            await security.flush_session_activity()
+        assert security._pending_activity == {"token-a"}
+
+        mock_db.execute.side_effect = None
+        assert await security.flush_session_activity() == 1
+        assert security._pending_activity == set()
+
+
+class TestJwtCache:
+    """Tests para el cache de verificación JWT"""
+
+    def test_verified_token_is_decoded_once(self):
+        """Un JWT válido solo se verifica una vez mientras está en cache."""
+        from app.core import security
+
+        token = security.create_session_token("user-1", "user@test.com")
+        security.invalidate_token(token)
+
+        with patch.object(security.jwt, "decode", wraps=security.jwt.decode) as decode:
+            assert security.verify_session_token(token)["user_id"] == "user-1"
+            assert security.validate_jwt_token(token)["email"] == "user@test.com"
+
+        assert decode.call_count == 1
+        security.invalidate_token(token)
+
+    def test_invalid_token_is_not_cached(self):
+        """Un token inválido no queda en cache."""
+        from app.core import security
+
+        assert security.verify_session_token("not-a-jwt") is None
+        assert security.jwt_cache.get("not-a-jwt") is None
@@ -216,11 +216,10 @@ def mock_authenticated_user(user_id: str = "test-user-123", email: str = "test@t
 
 def mock_session_validation():
     """Mock de validación de sesión que siempre pasa."""
-    async def mock_middleware(request, call_next):
-        response = await call_next(request)
-        return response
+    async def mock_call(self, scope, receive, send):
+        await self.app(scope, receive, send)
 
     return patch(
-        'app.core.middleware.session_validation_middleware',
-        mock_middleware
+        'app.core.middleware.AuthContextMiddleware.__call__',
+        mock_call
     )